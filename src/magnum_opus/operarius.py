@@ -6,6 +6,8 @@ import json
 import hashlib
 from datetime import datetime, timezone
 import re
+import sys
+import functools
 
 
 class LocalLogger:                                              # pragma: no cover
@@ -28,9 +30,173 @@ def override_logger(logger_class: object):                      # pragma: no cov
     logger = local_logger.get_logger()
 
 
+checksum_json_encoder = json.JSONEncoder()
+checksum_json_encoder_with_str_default = json.JSONEncoder(default=str)
+
+# Log messages are not hashed, so non-ASCII characters are written as is instead of being escaped
+log_json_encoder = json.JSONEncoder(default=str, ensure_ascii=False)
+
+
+def calculate_string_checksum(value: str)->str:
+    """Calculates the SHA256 checksum of a string
+
+    All checksums in this module are calculated here, so that the hashing backend is selected in one place. The
+    checksums are fingerprints of state and not security controls, which is declared with `usedforsecurity=False`.
+
+    Args:
+        value: The string to calculate the checksum for
+
+    Returns:
+        A string with the SHA256 hex digest
+    """
+    return hashlib.sha256(value.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def calculate_json_checksum(data: object, default_to_str: bool=False)->str:
+    """Calculates the SHA256 checksum of the JSON serialized form of `data`
+
+    The serialized form is exactly what `json.dumps()` with default arguments would produce, but the encoder is created
+    only once instead of on every call. The one-shot `encode()` call also keeps the C accelerated encoder in use, which
+    is faster than feeding the hash from `iterencode()` chunks.
+
+    Args:
+        data: Any JSON serializable object
+        default_to_str: If `True`, objects that are not JSON serializable will be converted with `str()`
+
+    Returns:
+        A string with the SHA256 hex digest
+    """
+    encoder = checksum_json_encoder
+    if default_to_str is True:
+        encoder = checksum_json_encoder_with_str_default
+    return calculate_string_checksum(value=encoder.encode(data))
+
+
+@functools.lru_cache(maxsize=1024)
+def build_variable_lookup_keys(raw_key: str, command: str, context: str)->tuple:
+    """Derives the variable store keys that a variable reference in a `Task` spec can resolve to
+
+    The same references are typically resolved many times with the same command and context, and the result only depends
+    on the input strings, so the result is cached.
+
+    Args:
+        raw_key: The variable reference, for example `${VAR:MyId:SubKey1:SubKey2}`
+        command: A string with the command of the execution scope
+        context: A string with the context of the execution scope
+
+    Returns:
+        A tuple with the target task id, the target index and a tuple of potential keys, starting with the key bound to
+        both the command and context and ending with the key not bound to either.
+    """
+    key_parts = raw_key.split(':')              # ['${VAR', 'MyId', 'SubKey1', 'SubKey2}']
+    target_task_id = key_parts[1]               # MyId
+    target_index = ':'.join(key_parts[2:])      # SubKey1:SubKey2
+    target_index = target_index.replace('}', '')
+    potential_keys = (
+        '{}:{}:{}:{}'.format(target_task_id, command, context, target_index),   # MyId:a_command:a_context:SubKey1:SubKey2 - variable bound to command and context
+        '{}:{}::{}'.format(target_task_id, command, target_index),              # MyId:a_command::SubKey1:SubKey2 - variable bound to command but not context
+        '{}::{}:{}'.format(target_task_id, context, target_index),              # MyId::a_context:SubKey1:SubKey2 - variable bound to context but not command
+        '{}:{}'.format(target_task_id, target_index),                           # MyId:SubKey1:SubKey2 - variable not bound to any command or context
+    )
+    return target_task_id, target_index, potential_keys
+
+
+@functools.lru_cache(maxsize=4096)
+def build_task_variable_name(task_id: str, variable_name: str)->str:
+    """Builds the name of a variable bound to a task, for example `my-task:PROCESSING_EVENTS`
+
+    The same few variable names are built for every task many times during processing, so the result is cached (and
+    interned).
+
+    Args:
+        task_id: The `Task` ID
+        variable_name: The variable name
+
+    Returns:
+        A string with the task bound variable name
+    """
+    return sys.intern('{}:{}'.format(task_id, variable_name))
+
+
+IMMUTABLE_VARIABLE_DATA_TYPES = frozenset((str, int, float, bool, bytes, type(None),))
+
+
+# Marks `commands` or `contexts` that are absent from a compiled processing scope item (a present `None` is kept as is)
+SCOPE_VALUES_NOT_DEFINED = object()
+
+
+def copy_variable_data(data: object, memo: dict=None)->object:
+    """Creates a deep copy of variable data, which is typically a tree of dicts and lists with simple values.
+
+    For plain dicts, lists and tuples this function rebuilds the containers directly, and immutable values are returned
+    as is. Any other type is still copied with `copy.deepcopy()`. Like `copy.deepcopy()`, copied containers are
+    remembered by `id()`, so an object referenced more than once is copied once and self-referencing data is supported.
+
+    Args:
+        data: The data to copy
+        memo: (optional) A dict of already copied objects keyed by `id()`, shared with `copy.deepcopy()`
+
+    Returns:
+        A copy of the data
+    """
+    data_type = type(data)
+    if data_type in IMMUTABLE_VARIABLE_DATA_TYPES:
+        return data
+    if memo is None:
+        memo = dict()
+    data_id = id(data)
+    if data_id in memo:
+        return memo[data_id]
+    if data_type is dict:
+        copied_dict = dict()
+        memo[data_id] = copied_dict
+        for key, value in data.items():
+            copied_dict[key] = copy_variable_data(data=value, memo=memo)
+        return copied_dict
+    if data_type is list:
+        copied_list = list()
+        memo[data_id] = copied_list
+        for value in data:
+            copied_list.append(copy_variable_data(data=value, memo=memo))
+        return copied_list
+    if data_type is tuple:
+        copied_tuple = tuple(copy_variable_data(data=value, memo=memo) for value in data)
+        # A tuple can not be remembered before its items are copied, so one of the items may already have copied it
+        if data_id in memo:
+            return memo[data_id]
+        memo[data_id] = copied_tuple
+        return copied_tuple
+    return copy.deepcopy(data, memo)
+
+
+def extract_string_parameter(parameters: dict, parameter_name: str, default: str=None)->str:
+    """Extracts a non-empty string parameter (like `Command` or `Context`) from a parameters dict
+
+    Parameter strings come from a small vocabulary and are therefore interned.
+
+    Args:
+        parameters: A dict with parameters
+        parameter_name: The name of the parameter to extract
+        default: The value to return when the parameter is missing, not a string or an empty string
+
+    Returns:
+        The parameter value or the default value
+    """
+    try:
+        value = parameters[parameter_name]
+    except (KeyError, TypeError):
+        return default
+    if isinstance(value, str) is False or len(value) == 0:
+        return default
+    return sys.intern(value)
+
+
+@functools.lru_cache(maxsize=64)
 def produce_column_headers(with_checksums: bool=False, space_len: int=2)->str:
     """Produce a string of formatted column headers, ideal for `TaskState` output in human readable column format.
 
+    The headers only depend on the arguments, so the result is cached.
+
     Args:
         with_checksums: boolean (default=False) - If True. include checksum columns
         space_len: int (default=2). The number of spaces between column boundaries
@@ -58,8 +224,11 @@ def produce_column_headers(with_checksums: bool=False, space_len: int=2)->str:
     return report_column_header
 
 
+@functools.lru_cache(maxsize=64)
 def produce_column_header_horizontal_line(with_checksums: bool=False, space_len: int=2, line_char: str='-')->str:
-    """Function description
+    """Produce a horizontal line matching the width of the column headers from `produce_column_headers()`.
+
+    The line only depends on the arguments, so the result is cached.
 
     Args:
         with_checksums: boolean (default=False) - If True. include checksum columns in total length calculation
@@ -137,6 +306,7 @@ class TaskState:
             applied_resources_checksum: A string with the SHA256 checksum after the initial resource creation process was completed
             current_resource_checksum: A string with the SHA256 checksum of the current state of running resources. A difference to the `applied_resources_checksum` could indicate some changes in the deployed resources that was not applied through task processing.
         """
+        self._applied_spec_checksum = None
         self.raw_spec = manifest_spec
         self.raw_metadata = manifest_metadata
         self.report_label = report_label
@@ -150,6 +320,24 @@ class TaskState:
         self.applied_resources_checksum = applied_resources_checksum
         self.current_resource_checksum = current_resource_checksum
 
+    @property
+    def applied_spec(self)->dict:
+        """The spec as it was last applied. Assign a new spec to change it, as changes made in place are not detected."""
+        return self._applied_spec
+
+    @applied_spec.setter
+    def applied_spec(self, value: dict):
+        # A private copy is kept, so that changes to the given dict can not make the cached checksum stale
+        self._applied_spec = copy_variable_data(data=value)
+        self._applied_spec_checksum = None
+
+    def _get_applied_spec_checksum(self)->str:
+        # The applied spec only changes when resources are created, updated or deleted, while drift detection runs
+        # much more often. The checksum is therefore kept until a new applied spec is assigned.
+        if self._applied_spec_checksum is None:
+            self._applied_spec_checksum = self.calculate_manifest_state_checksum(spec=self._applied_spec)
+        return self._applied_spec_checksum
+
     def update_applied_spec(self, new_applied_spec: dict, new_applied_resource_checksum: str, updated_timestamp: int):
         """Updates state variables after a resources were created/updated/deleted.
 
@@ -161,10 +349,10 @@ class TaskState:
             new_applied_resource_checksum: The newly calculated resource checksum value as a string
             updated_timestamp: The Unix timestamp of when the resources were created/updated/deleted
         """
-        self.applied_spec = copy.deepcopy(new_applied_spec)
+        self.applied_spec = new_applied_spec
         if new_applied_resource_checksum is not None:
-            self.applied_resources_checksum = copy.deepcopy(new_applied_resource_checksum)
-            self.current_resource_checksum = copy.deepcopy(new_applied_resource_checksum)
+            self.applied_resources_checksum = new_applied_resource_checksum
+            self.current_resource_checksum = new_applied_resource_checksum
         else:
             self.applied_resources_checksum = None
             self.current_resource_checksum = None
@@ -190,7 +378,7 @@ class TaskState:
             'spec': spec,
             'metadata': metadata
         }
-        return hashlib.sha256(json.dumps(data).encode('utf-8')).hexdigest()
+        return calculate_json_checksum(data=data)
     
     def to_dict(
             self,
@@ -272,11 +460,18 @@ class TaskState:
             if isinstance(current_resource_checksum, str):
                 self.current_resource_checksum = current_resource_checksum
 
+        # Each checksum is calculated at most once per call, as the same values are needed for drift detection and
+        # for the checksum summary
+        applied_spec_checksum = None
+        current_resolved_spec_checksum = None
+
         if human_readable is True:
             data['SpecDrifted'] = 'No'
         if self.is_created is True:
             if self.current_resolved_spec is not None and self.applied_spec is not None:
-                if self.calculate_manifest_state_checksum(spec=self.applied_spec) != self.calculate_manifest_state_checksum(spec=self.current_resolved_spec):
+                applied_spec_checksum = self._get_applied_spec_checksum()
+                current_resolved_spec_checksum = self.calculate_manifest_state_checksum(spec=self.current_resolved_spec)
+                if applied_spec_checksum != current_resolved_spec_checksum:
                     data['SpecDrifted'] = True
                     if human_readable is True:
                         data['SpecDrifted'] = 'Yes'
@@ -318,11 +513,15 @@ class TaskState:
 
             if self.applied_spec is not None:
                 if isinstance(self.applied_spec, dict) is True and self.is_created is True:
-                    data['AppliedSpecChecksum'] = self.calculate_manifest_state_checksum(spec=self.applied_spec)
+                    if applied_spec_checksum is None:
+                        applied_spec_checksum = self._get_applied_spec_checksum()
+                    data['AppliedSpecChecksum'] = applied_spec_checksum
 
             if self.current_resolved_spec is not None:
                 if isinstance(self.current_resolved_spec, dict) is True:
-                    data['CurrentResolvedSpecChecksum'] = self.calculate_manifest_state_checksum(spec=current_resolved_spec)
+                    if current_resolved_spec_checksum is None or current_resolved_spec is not self.current_resolved_spec:
+                        current_resolved_spec_checksum = self.calculate_manifest_state_checksum(spec=current_resolved_spec)
+                    data['CurrentResolvedSpecChecksum'] = current_resolved_spec_checksum
             
             if self.applied_resources_checksum is not None:
                 if isinstance(self.applied_resources_checksum, str) is True and self.is_created is True:
@@ -559,61 +758,75 @@ class TaskProcessingActionParameterValidation(ParameterValidation):
     """
     A specific implementation to validate parameters that describe actions at
     runtime. Used internally by various built-in hooks.
+
+    The supported values in `constraints` are compiled into matchers, which are
+    rebuilt whenever the supported values change, so `constraints` may still be
+    modified directly.
     """
 
     def __init__(self, constraints: object, auto_init_supported_actions: bool=True):
         final_constraints = dict()
-        final_constraints['SupportedCommands'] = list()
-        final_constraints['SupportedContexts'] = list()
-        final_constraints['SupportedActions'] =  list()
-        if constraints is not None:
-            if isinstance(constraints, dict):
-                if 'SupportedCommands' in constraints:
-                    if isinstance(constraints['SupportedCommands'], list) is True:
-                        for command in constraints['SupportedCommands']:
-                            if command is not None:
-                                if isinstance(command, str):
-                                    if len(command) > 0:
-                                        final_constraints['SupportedCommands'].append(command)
-                if 'SupportedContexts' in constraints:
-                    if isinstance(constraints['SupportedContexts'], list) is True:
-                        for context in constraints['SupportedContexts']:
-                            if context is not None:
-                                if isinstance(context, str):
-                                    if len(context) > 0:
-                                        final_constraints['SupportedContexts'].append(context)
-                if 'SupportedActions' in constraints:
-                    if isinstance(constraints['SupportedActions'], list) is True:
-                        for action in constraints['SupportedActions']:
-                            if action is not None:
-                                if isinstance(action, str):
-                                    if len(action) > 0:
-                                        final_constraints['SupportedActions'].append(action)
+        final_constraints['SupportedCommands'] = self._extract_supported_values(constraints=constraints, constraint_name='SupportedCommands')
+        final_constraints['SupportedContexts'] = self._extract_supported_values(constraints=constraints, constraint_name='SupportedContexts')
+        final_constraints['SupportedActions'] =  self._extract_supported_values(constraints=constraints, constraint_name='SupportedActions')
         if len(final_constraints['SupportedActions']) == 0 and auto_init_supported_actions is True:
             final_constraints['SupportedActions'] = ['CreateAction','RollbackAction','DeleteAction','UpdateAction','DescribeAction','DetectDriftAction',]
         super().__init__(final_constraints)
+        self._build_matchers()
+
+    def _extract_supported_values(self, constraints: object, constraint_name: str)->list:
+        try:
+            values = constraints[constraint_name]
+        except (KeyError, TypeError):
+            return list()
+        if isinstance(values, list) is False:
+            return list()
+        return [sys.intern(value) for value in values if isinstance(value, str) is True and len(value) > 0]
+
+    def _build_matcher(self, supported_values: list):
+        """Compiles a list of supported values into a single predicate.
+
+        An empty list means no constraint was set and every value is accepted. Otherwise the predicate is a membership
+        test against a `frozenset` of the supported values.
+
+        Args:
+            supported_values: A list of strings
+
+        Returns:
+            A callable that accepts a single value and returns a boolean
+        """
+        if len(supported_values) == 0:
+            return lambda value: True
+        return frozenset(supported_values).__contains__
+
+    def _build_matchers(self):
+        self._matched_constraints = self._current_constraints()
+        self._command_matches = self._build_matcher(supported_values=self.constraints['SupportedCommands'])
+        self._context_matches = self._build_matcher(supported_values=self.constraints['SupportedContexts'])
+        self._action_matches = frozenset(self.constraints['SupportedActions']).__contains__
+
+    def _current_constraints(self)->tuple:
+        return (
+            tuple(self.constraints['SupportedCommands']),
+            tuple(self.constraints['SupportedContexts']),
+            tuple(self.constraints['SupportedActions']),
+        )
 
     def add_command(self, command: str):
         if command is not None:
             if isinstance(command, str) is True:
                 if len(command) > 0:
-                    self.constraints['SupportedCommands'].append(command)
+                    self.constraints['SupportedCommands'].append(sys.intern(command))
         return self
     
     def add_context(self, context: str):
         if context is not None:
             if isinstance(context, str) is True:
                 if len(context) > 0:
-                    self.constraints['SupportedContexts'].append(context)
+                    self.constraints['SupportedContexts'].append(sys.intern(context))
         return self
 
     def validation_passed(self, parameters: dict = dict()) -> bool:
-        command = None
-        context = None
-        action = None
-        final_command_constraints = list()
-        final_context_constraints = list()
-        
         if parameters is None:
             logger.warning('Parameters was NoneType - expected a dict')
             return False
@@ -621,51 +834,28 @@ class TaskProcessingActionParameterValidation(ParameterValidation):
             logger.warning('Parameters was {} - expected a dict'.format(type(parameters)))
             return False
 
-        if 'Command' in parameters:
-            if parameters['Command'] is not None:
-                if isinstance(parameters['Command'], str) is True:
-                    if len(parameters['Command']) > 0:
-                        command = parameters['Command']
-        if 'Context' in parameters:
-            if parameters['Context'] is not None:
-                if isinstance(parameters['Context'], str) is True:
-                    if len(parameters['Context']) > 0:
-                        context = parameters['Context']
-        if 'Action' in parameters:
-            if parameters['Action'] is not None:
-                if isinstance(parameters['Action'], str) is True:
-                    if len(parameters['Action']) > 0:
-                        action = parameters['Action']
+        command = extract_string_parameter(parameters=parameters, parameter_name='Command')
+        context = extract_string_parameter(parameters=parameters, parameter_name='Context')
+        action = extract_string_parameter(parameters=parameters, parameter_name='Action')
         if 'ResolvedSpec' not in parameters:
             logger.warning('ResolvedSpec was not present in parameters - the Task spec will be used as is')
 
-        if len(self.constraints['SupportedCommands']) == 0:
-            final_command_constraints = [copy.deepcopy(command),]
-        else:
-            final_command_constraints = self.constraints['SupportedCommands']
-        if len(self.constraints['SupportedContexts']) == 0:
-            final_context_constraints = [copy.deepcopy(context),]
-        else:
-            final_context_constraints = self.constraints['SupportedContexts']
-
-        logger.debug('Final command constraints : {}'.format(final_command_constraints))
-        logger.debug('Final context constraints : {}'.format(final_context_constraints))
+        logger.debug('Final command constraints : {}'.format(self.constraints['SupportedCommands']))
+        logger.debug('Final context constraints : {}'.format(self.constraints['SupportedContexts']))
         logger.debug('Final action constraints  : {}'.format(self.constraints['SupportedActions']))
         logger.debug('Input command             : {}'.format(command))
         logger.debug('Input context             : {}'.format(context))
         logger.debug('Input action              : {}'.format(action))
 
-        if command not in final_command_constraints:
-            for catch_all_str in ('*', 'ALL', 'ANY'):
-                if command != catch_all_str:
-                    logger.warning('SupportedCommands validation failed')
-                    return False
-        if context not in final_context_constraints:
-            for catch_all_str in ('*', 'ALL', 'ANY'):
-                if context != catch_all_str:
-                    logger.warning('SupportedContexts validation failed')
-                    return False
-        if action not in self.constraints['SupportedActions']:
+        if self._current_constraints() != self._matched_constraints:
+            self._build_matchers()
+        if self._command_matches(command) is False:
+            logger.warning('SupportedCommands validation failed')
+            return False
+        if self._context_matches(context) is False:
+            logger.warning('SupportedContexts validation failed')
+            return False
+        if self._action_matches(action) is False:
             logger.warning('SupportedActions validation failed')
             return False
         return True
@@ -676,9 +866,35 @@ class VariableStore:
     def __init__(self) -> None:
         self.variable_store = dict()
 
+    def clone(self):
+        """Creates an independent copy of this `VariableStore`, using `copy_variable_data()`
+
+        Returns:
+            A new instance of `VariableStore`
+        """
+        cloned_variable_store = VariableStore()
+        cloned_variable_store.variable_store = copy_variable_data(data=self.variable_store)
+        return cloned_variable_store
+
+    def shallow_clone(self):
+        """Creates a copy of this `VariableStore` that shares the variable values with this instance
+
+        Adding, replacing or removing variables in the copy does not affect this instance, but values must not be
+        modified in place. Use `clone()` when values will be modified.
+
+        Returns:
+            A new instance of `VariableStore`
+        """
+        cloned_variable_store = VariableStore()
+        cloned_variable_store.variable_store = self.variable_store.copy()
+        return cloned_variable_store
+
     def add_variable(self, variable_name: str, value: object):
-        self.variable_store[variable_name] = copy.deepcopy(value)
+        self.variable_store[variable_name] = copy_variable_data(data=value)
         return self
+
+    def __contains__(self, variable_name: str)->bool:
+        return variable_name in self.variable_store
     
     def get_variable(self, variable_name: str, pop_item: bool=False)->object:
         result = None
@@ -687,7 +903,7 @@ class VariableStore:
         if pop_item is True:
             result = self.variable_store.pop(variable_name)
         else:
-            result = copy.deepcopy(self.variable_store[variable_name])
+            result = copy_variable_data(data=self.variable_store[variable_name])
         return result
 
 
@@ -780,6 +996,7 @@ class Task:
         kind: A descriptor of the kind of task, that a `TaskProcessor` can use to make further decisions as to how to process the `Task`
         metadata: A dict defining task meta data
         spec: A dict with fields required by the `TaskProcessor` to successfully process the task.
+        spec_json: The JSON serialization of `spec` (calculated once and cached until `spec` is replaced)
         state: An instance of `TaskState`
     """
 
@@ -793,30 +1010,60 @@ class Task:
             spec: A dict with fields required by the `TaskProcessor` to successfully process the task.
             task_state_class: A `TaskState` class (not instantiated) that will use by default `TaskState` class for state
         """
-        self.api_version = api_version
-        self.kind = kind
+        self._spec_json = None
+        self.api_version = self._intern(value=api_version)
+        self.kind = self._intern(value=kind)
         self.metadata = self._validate_dict(input_object=metadata)
         self.spec = self._validate_dict(input_object=spec)
-        self.task_id = self._create_task_id(metadata=metadata)
+        self.task_id = self._intern(value=self._create_task_id(metadata=metadata))
         self.state = task_state_class(
             manifest_spec=spec,
             manifest_metadata=metadata,
             report_label=self.task_id
         )
 
+    @property
+    def spec(self)->dict:
+        return self._spec
+
+    @spec.setter
+    def spec(self, value: dict):
+        self._spec = value
+        self._spec_json = None
+
+    @property
+    def spec_json(self)->str:
+        """The JSON serialization of the `spec` (non-serializable values are converted to strings)
+
+        The serialization is calculated on first access and cached. Assigning a new `spec` clears the cache, but
+        changing the `spec` dictionary in place does not.
+
+        Returns:
+            A JSON string
+        """
+        if self._spec_json is None:
+            self._spec_json = checksum_json_encoder_with_str_default.encode(self._spec)
+        return self._spec_json
+
+    def _intern(self, value: object)->object:
+        # API versions, kinds and task names are repeated in many tasks and used as dictionary keys throughout
+        if isinstance(value, str) is True:
+            return sys.intern(value)
+        return value
+
     def _create_task_id(self, metadata: dict)->str:
-        if metadata is not None:
-            if isinstance(metadata, dict):
-                if 'name' in metadata:
-                    return metadata['name']
-        return hashlib.sha256(json.dumps(self.spec, default=str).encode('utf-8')).hexdigest()[0:16]
+        try:
+            return metadata['name']
+        except (KeyError, TypeError):
+            pass
+        return calculate_string_checksum(value=self.spec_json)[0:16]
 
     def _validate_dict(self, input_object: dict=dict()):
         if input_object is None:
             return dict()
         if isinstance(input_object, dict) is False:
             return dict()
-        return copy.deepcopy(input_object)
+        return copy_variable_data(data=input_object)
     
     def auto_rollback_enabled(self)->bool:
         """If `autoRollback` is defined in metadata, extract the value and return to the client.
@@ -850,6 +1097,11 @@ class Tasks(Sequence):
         """Initializes `Tasks`
         """
         self.tasks = dict()
+        self._reset_cached_indexes()
+
+    def _reset_cached_indexes(self):
+        self._sorted_task_names = None
+        self._topological_sort_cache = dict()
 
     def add_task(self, task: Task):
         """Adds a valid `Task` instance to the collection of tasks.
@@ -862,12 +1114,36 @@ class Tasks(Sequence):
         Returns:
             None
         """
+        self._add_task_without_index_reset(task=task)
+        self._reset_cached_indexes()
+
+    def _add_task_without_index_reset(self, task: Task):
         if task is not None:
             if isinstance(task, Task):
+                task_instance = copy.deepcopy(task)
                 self.tasks[task.task_id] = dict()
-                self.tasks[task.task_id]['TaskInstance'] = copy.deepcopy(task)
-                self.tasks[task.task_id]['TaskDependencies'] = self._extract_task_dependencies(metadata=task.metadata)
-                self.tasks[task.task_id]['TaskProcessingScopes'] = self._extract_task_processing_scopes(metadata=task.metadata)
+                self.tasks[task.task_id]['TaskInstance'] = task_instance
+                self.tasks[task.task_id]['TaskDependencies'] = self._extract_task_dependencies(metadata=task_instance.metadata)
+                self.tasks[task.task_id]['TaskProcessingScopes'] = self._extract_task_processing_scopes(metadata=task_instance.metadata)
+                self.tasks[task.task_id]['CompiledProcessingScope'] = self._compile_task_processing_scope(task_name=task.task_id, metadata=task_instance.metadata)
+                self.tasks[task.task_id]['CompiledDependencies'] = self._compile_task_dependencies(task_name=task.task_id, task_dependencies=self.tasks[task.task_id]['TaskDependencies'])
+
+    def add_tasks(self, tasks: list):
+        """Adds several `Task` instances to the collection of tasks, in the given order.
+
+        The cached task name index and task ordering are reset once after all tasks were added.
+
+        WARNING: Invalid tasks will be silently ignored.
+
+        Args:
+            tasks: A list (or any iterable) of `Task` instances
+
+        Returns:
+            None
+        """
+        for task in tasks:
+            self._add_task_without_index_reset(task=task)
+        self._reset_cached_indexes()
 
     def get_task_instance_by_name(self, task_name: str)->Task:
         """Returns a `Task` instance matching the `task_name`
@@ -881,7 +1157,7 @@ class Tasks(Sequence):
         if task_name in self.tasks:
             return copy.deepcopy(self.tasks[task_name]['TaskInstance'])
         
-    def get_task_dependencies_as_list_of_task_names(self, task_name: str, command: str, context: str)->list:
+    def get_task_dependencies_as_list_of_task_names(self, task_name: str, command: str, context: str, scope_cache: dict=None)->list:
         """Determine the dependant tasks of the given task within a certain processing scope (command and context
         combination)
 
@@ -889,6 +1165,7 @@ class Tasks(Sequence):
             task_name: A string with the task name to lookup and return
             command: A string with the command of the execution scope
             context: A string with the context of the execution scope
+            scope_cache: (optional) A dict used to remember the outcome of `task_scoped_for_processing()` calls. See `_task_scoped_for_processing_cached()`
 
         Returns:
             A list of strings, where each string is the task name of a dependent task given the current execution scope.
@@ -898,29 +1175,90 @@ class Tasks(Sequence):
         """
         dependencies = list()
         if task_name in self.tasks:
-            task_defined_dependencies = self.tasks[task_name]['TaskDependencies']
-            task_defined_dependency: dict
-            for task_defined_dependency in task_defined_dependencies:
-                if 'tasks' in task_defined_dependency:
-
-                    for dependant_task_name in task_defined_dependency['tasks']:
-                        if self.task_scoped_for_processing(task_name=dependant_task_name, command=command, context=context) is False:
-                            logger.critical('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
-                            raise Exception('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
-
-                    if 'commands' not in task_defined_dependency and 'contexts' not in task_defined_dependency:
-                        dependencies += task_defined_dependency['tasks']
-                    elif 'commands' not in task_defined_dependency and 'contexts' in task_defined_dependency:
-                        if context in task_defined_dependency['contexts']:
-                            dependencies += task_defined_dependency['tasks']
-                    elif 'commands' in task_defined_dependency and 'contexts' not in task_defined_dependency:
-                        if command in task_defined_dependency['commands']:
-                            dependencies += task_defined_dependency['tasks']
-                    elif 'commands' in task_defined_dependency and 'contexts' in task_defined_dependency:
-                        if command in task_defined_dependency['commands'] and context in task_defined_dependency['contexts']:
-                            dependencies += task_defined_dependency['tasks']
+            for dependant_task_names, commands, contexts, uncompiled_task_dependency in self.tasks[task_name]['CompiledDependencies']:
+                if uncompiled_task_dependency is not None:
+                    dependencies += self._get_uncompiled_task_dependency_task_names(task_name=task_name, task_defined_dependency=uncompiled_task_dependency, command=command, context=context, scope_cache=scope_cache)
+                    continue
+                for dependant_task_name in dependant_task_names:
+                    if self._task_scoped_for_processing_cached(task_name=dependant_task_name, command=command, context=context, scope_cache=scope_cache) is False:
+                        logger.critical('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
+                        raise Exception('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
+                if commands is not SCOPE_VALUES_NOT_DEFINED and command not in commands:
+                    continue
+                if contexts is not SCOPE_VALUES_NOT_DEFINED and context not in contexts:
+                    continue
+                dependencies += dependant_task_names
         return dependencies
 
+    def _get_uncompiled_task_dependency_task_names(self, task_name: str, task_defined_dependency: object, command: str, context: str, scope_cache: dict=None)->list:
+        """Evaluates a dependency item that could not be compiled by `_compile_task_dependencies()`, exactly as it is
+        defined in the task metadata.
+
+        Malformed items therefore still raise the same exceptions as before, but only once the task is ordered for an
+        execution scope in which it is processed.
+
+        Args:
+            task_name: A string with the task name of the task that defines the dependency
+            task_defined_dependency: The dependency item as defined in the task metadata
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+            scope_cache: (optional) A dict used to remember the outcome of `task_scoped_for_processing()` calls
+
+        Returns:
+            A list of strings, where each string is the task name of a dependent task given the current execution scope.
+
+        Raises:
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination)
+            TypeError: When the dependency item, or its `tasks`, `commands` or `contexts` values, are of an unsupported type
+        """
+        if 'tasks' not in task_defined_dependency:
+            return list()
+        for dependant_task_name in task_defined_dependency['tasks']:
+            if self._task_scoped_for_processing_cached(task_name=dependant_task_name, command=command, context=context, scope_cache=scope_cache) is False:
+                logger.critical('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
+                raise Exception('Task "{}" depends on task "{}", but th dependant task is NOT scoped for this command and/or context. Unable to determine how to proceed - please resolve dependencies and scopes.'.format(task_name, dependant_task_name))
+        if 'commands' in task_defined_dependency and command not in task_defined_dependency['commands']:
+            return list()
+        if 'contexts' in task_defined_dependency and context not in task_defined_dependency['contexts']:
+            return list()
+        return list(task_defined_dependency['tasks'])
+
+    def _compile_task_dependencies(self, task_name: str, task_dependencies: list)->tuple:
+        """Compiles the dependencies extracted by `_extract_task_dependencies()` into a form that can be evaluated with
+        simple membership tests.
+
+        Dependency items without `tasks` are ignored. Items that are not a dict, or of which the `tasks` value is not a
+        list, tuple or set, are not compiled but kept as is, to be evaluated by `_get_uncompiled_task_dependency_task_names()`
+        when the task is ordered.
+
+        Args:
+            task_name: A string with the task name (used for logging)
+            task_dependencies: A list of dependency items (dicts)
+
+        Returns:
+            A tuple of `(task_names, commands, contexts, uncompiled_task_dependency)` tuples where `task_names` is a tuple
+            of task names, `commands` and `contexts` are each either a frozenset, or `SCOPE_VALUES_NOT_DEFINED` when not
+            defined in the dependency item, and `uncompiled_task_dependency` is `None`. For items that could not be
+            compiled, `uncompiled_task_dependency` holds the original item and the other values are `None`.
+        """
+        compiled_dependencies = list()
+        task_defined_dependency: dict
+        for task_defined_dependency in task_dependencies:
+            if isinstance(task_defined_dependency, dict) is False or ('tasks' in task_defined_dependency and isinstance(task_defined_dependency['tasks'], (list, tuple, set)) is False):
+                logger.warning('[task={}] Dependency item is malformed and can not be compiled - it will be evaluated as is when the task is ordered: {}'.format(task_name, task_defined_dependency))
+                compiled_dependencies.append((None, None, None, task_defined_dependency,))
+                continue
+            if 'tasks' not in task_defined_dependency:
+                continue
+            commands = SCOPE_VALUES_NOT_DEFINED
+            contexts = SCOPE_VALUES_NOT_DEFINED
+            if 'commands' in task_defined_dependency:
+                commands = self._compile_scope_values(values=task_defined_dependency['commands'])
+            if 'contexts' in task_defined_dependency:
+                contexts = self._compile_scope_values(values=task_defined_dependency['contexts'])
+            compiled_dependencies.append((self._intern_values(values=task_defined_dependency['tasks']), commands, contexts, None,))
+        return tuple(compiled_dependencies)
+
     def _extract_task_dependencies(self, metadata: dict)->list:
         """
             metadata:
@@ -947,12 +1285,17 @@ class Tasks(Sequence):
                 - task_id_4
                 - task_id_7
                 - task_id_8
+
+            The returned list is not copied - `add_task()` passes in the metadata of the private copy of the `Task`
+            it keeps, so the list is never shared with the caller.
         """
-        if 'dependencies' in metadata:
-            if metadata['dependencies'] is not None:
-                if isinstance(metadata['dependencies'], list):
-                    return copy.deepcopy(metadata['dependencies'])
-        return list()
+        try:
+            dependencies = metadata['dependencies']
+        except KeyError:
+            return list()
+        if isinstance(dependencies, list) is False:
+            return list()
+        return dependencies
     
     def _extract_task_processing_scopes(self, metadata: dict)->list:
         """
@@ -970,12 +1313,16 @@ class Tasks(Sequence):
               - commands:       # No contexts, mean any context, but only for the listed commands
                 - command3
                 - command4
+
+            As with `_extract_task_dependencies()`, the returned list is not copied.
         """
-        if 'processingScopes' in metadata:
-            if metadata['processingScopes'] is not None:
-                if isinstance(metadata['processingScopes'], list):
-                    return copy.deepcopy(metadata['processingScopes'])
-        return list()
+        try:
+            processing_scopes = metadata['processingScopes']
+        except KeyError:
+            return list()
+        if isinstance(processing_scopes, list) is False:
+            return list()
+        return processing_scopes
     
     def task_scoped_for_processing(self, task_name: str, command: str, context: str)->bool:
         """Determine if a task is in scope for processing given the execution scope (command and context)
@@ -1030,22 +1377,70 @@ class Tasks(Sequence):
         Returns:
             Boolean `True` if the given task is in scope for processing.
         """
-        task = self.get_task_instance_by_name(task_name=task_name)
-        if 'processingScope' not in task.metadata:
-            logger.info('[task={}] processingScope not present in task metadata - task scoped for command "{}" and context "{}"'.format(task_name, command, context))
-            return True
-        if task.metadata['processingScope'] is None:
-            logger.warning('[task={}] processingScope present in task metadata, but NoneType - task scoped for command "{}" and context "{}"'.format(task_name, command, context))
+        compiled_processing_scope = self.tasks[task_name]['CompiledProcessingScope']
+        if compiled_processing_scope is None:
+            logger.info('[task={}] No processingScope rules - task scoped for command "{}" and context "{}"'.format(task_name, command, context))
             return True
-        if isinstance(task.metadata['processingScope'], list) is False:
-            logger.warning('[task={}] processingScope present in task metadata, but not a list type - task scoped for command "{}" and context "{}"'.format(task_name, command, context))
-            return True
-        
+
         logger.debug('[task={}] Command         : {}'.format(task_name, command))
-        logger.debug('[task={}] Context         : {}'.format(task_name, command))
+        logger.debug('[task={}] Context         : {}'.format(task_name, context))
+
+        for commands, contexts in compiled_processing_scope:
+            if commands is SCOPE_VALUES_NOT_DEFINED and contexts is SCOPE_VALUES_NOT_DEFINED:
+                logger.warning('[task={}] Neither command or context was defined - returning True...'.format(task_name))
+                return True
+            elif contexts is SCOPE_VALUES_NOT_DEFINED:
+                if command in commands:
+                    logger.info('[task={}] Command matches and no contexts defined - returning True'.format(task_name))
+                    return True
+            elif commands is SCOPE_VALUES_NOT_DEFINED:
+                if context in contexts:
+                    logger.info('[task={}] No commands defined but contexts matches - returning True'.format(task_name))
+                    return True
+            elif command in commands and context in contexts:
+                logger.info('[task={}] Command and context matches - returning True'.format(task_name))
+                return True
+        return False
+
+    def _intern_values(self, values: object)->tuple:
+        # Task names, commands and contexts are compared and hashed over and over while tasks are ordered
+        return tuple(sys.intern(value) if isinstance(value, str) is True else value for value in values)
+
+    def _compile_scope_values(self, values: object)->object:
+        if isinstance(values, (list, tuple, set)) is True:
+            return frozenset(self._intern_values(values=values))
+        return values
+
+    def _compile_task_processing_scope(self, task_name: str, metadata: dict)->tuple:
+        """Compiles the `processingScope` metadata of a task into rules that `task_scoped_for_processing()` can
+        evaluate with simple membership tests.
+
+        The `processingScope` of a task never changes once the task was added, so this is done only once in
+        `add_task()`.
+
+        Args:
+            task_name: A string with the task name (used for logging)
+            metadata: The task metadata dict
 
+        Returns:
+            `None` if the task is scoped for any command and context, otherwise a tuple of `(commands, contexts)` pairs
+            where either value is a frozenset, or `SCOPE_VALUES_NOT_DEFINED` when not defined in the scope item. Values
+            that are not a list, tuple or set (including `None`) are kept as is, so membership tests on them behave as
+            they would on the original metadata.
+        """
+        if 'processingScope' not in metadata:
+            logger.info('[task={}] processingScope not present in task metadata - task scoped for all commands and contexts'.format(task_name))
+            return None
+        if metadata['processingScope'] is None:
+            logger.warning('[task={}] processingScope present in task metadata, but NoneType - task scoped for all commands and contexts'.format(task_name))
+            return None
+        if isinstance(metadata['processingScope'], list) is False:
+            logger.warning('[task={}] processingScope present in task metadata, but not a list type - task scoped for all commands and contexts'.format(task_name))
+            return None
+
+        compiled_processing_scope = list()
         processing_scope: dict
-        for processing_scope in task.metadata['processingScope']:
+        for processing_scope in metadata['processingScope']:
 
             if processing_scope is None:
                 logger.warning('[task={}] Processing scope item expected to be a dict but is NoneType - skipping'.format(task_name))
@@ -1055,44 +1450,175 @@ class Tasks(Sequence):
                 logger.warning('[task={}] Processing scope item expected to be a dict but found a "{}" - skipping'.format(task_name, type(processing_scope)))
                 continue
 
-            logger.debug('[task={}] processingScope : {}'.format(task_name, json.dumps(processing_scope, default=str)))
+            logger.debug('[task={}] processingScope : {}'.format(task_name, log_json_encoder.encode(processing_scope)))
 
-            if 'commands' not in processing_scope and 'contexts' not in processing_scope:
-                logger.warning('[task={}] Neither command or context was defined - returning True...'.format(task_name))
-                return True
-            elif 'commands' in processing_scope and 'contexts' not in processing_scope:
-                if command in processing_scope['commands']:
-                    logger.info('[task={}] Command matches and no contexts defined - returning True'.format(task_name))
-                    return True
-            elif 'commands' not in processing_scope and 'contexts' in processing_scope:
-                if context in processing_scope['contexts']:
-                    logger.info('[task={}] No commands defined but contexts matches - returning True'.format(task_name))
-                    return True
-            elif 'commands' in processing_scope and 'contexts' in processing_scope:
-                if command in processing_scope['commands'] and context in processing_scope['contexts']:
-                    logger.info('[task={}] Command and context matches - returning True'.format(task_name))
-                    return True
-        return False
+            commands = SCOPE_VALUES_NOT_DEFINED
+            contexts = SCOPE_VALUES_NOT_DEFINED
+            if 'commands' in processing_scope:
+                commands = self._compile_scope_values(values=processing_scope['commands'])
+            if 'contexts' in processing_scope:
+                contexts = self._compile_scope_values(values=processing_scope['contexts'])
+            compiled_processing_scope.append((commands, contexts,))
+        return tuple(compiled_processing_scope)
+
+    def get_task_names_scoped_for_processing(self, command: str, context: str, scope_cache: dict=None)->list:
+        """Evaluates the processing scope of all tasks in one pass for the given execution scope (command and context)
+
+        Args:
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+            scope_cache: (optional) A dict that will be updated with the outcome for each task, keyed by `(task_name, command, context)`. See `_task_scoped_for_processing_cached()`
+
+        Returns:
+            A list of task names, in the order the tasks were added, of all tasks scoped for processing.
+        """
+        if scope_cache is None:
+            scope_cache = dict()
+        scoped_task_names = list()
+        for task_name in self.tasks:
+            if self._task_scoped_for_processing_cached(task_name=task_name, command=command, context=context, scope_cache=scope_cache) is True:
+                scoped_task_names.append(task_name)
+        return scoped_task_names
+
+    def _task_scoped_for_processing_cached(self, task_name: str, command: str, context: str, scope_cache: dict=None)->bool:
+        """Same as `task_scoped_for_processing()`, but remembers the result in `scope_cache`
+
+        The outcome of `task_scoped_for_processing()` only depends on the task name, command and context, so within a
+        single ordering run each task only has to be evaluated once.
+
+        Args:
+            task_name: A string with the task name to lookup and return
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+            scope_cache: A dict keyed by `(task_name, command, context)`. If `None`, no caching is done.
+
+        Returns:
+            Boolean `True` if the given task is in scope for processing.
+        """
+        if scope_cache is None:
+            return self.task_scoped_for_processing(task_name=task_name, command=command, context=context)
+        key = (task_name, command, context)
+        if key not in scope_cache:
+            scope_cache[key] = self.task_scoped_for_processing(task_name=task_name, command=command, context=context)
+        return scope_cache[key]
+
+    def _task_ordering(self, current_processing_order: list, candidate_task_name: str, command: str, context: str, scope_cache: dict=None)->list:
+        """Appends a candidate task, preceded by all its (transitive) dependencies, to a processing order
+
+        This uses the same depth first walk as `get_task_names_in_order()`. See `_add_task_in_dependency_order()`.
+
+        Args:
+            current_processing_order: A list of task names already in processing order. This list is not modified.
+            candidate_task_name: The name of the task to add
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+            scope_cache: (optional) A dict used to remember the outcome of `task_scoped_for_processing()` calls
 
-    def _task_ordering(self, current_processing_order: list, candidate_task_name: str, command: str, context: str)->list:
-        task_names_in_preferred_processing_order = list()
-        task_names_in_preferred_processing_order += copy.deepcopy(current_processing_order)
-
-        if self.task_scoped_for_processing(task_name=candidate_task_name, command=command, context=context) is True:
-            for dependant_task_name in self.get_task_dependencies_as_list_of_task_names(task_name=candidate_task_name, command=command, context=context):
-                if self.task_scoped_for_processing(task_name=dependant_task_name, command=command, context=context) is True:
-                    if dependant_task_name not in task_names_in_preferred_processing_order:
-                        task_names_in_preferred_processing_order += self._task_ordering(
-                            current_processing_order=copy.deepcopy(task_names_in_preferred_processing_order),
-                            candidate_task_name=dependant_task_name,
-                            command=command,
-                            context=context
-                        )
-            if candidate_task_name not in task_names_in_preferred_processing_order:
-                task_names_in_preferred_processing_order.append(candidate_task_name)
+        Returns:
+            A new list, starting with `current_processing_order`, followed by the dependencies of the candidate task that
+            were not yet in the list and then the candidate task itself. If the candidate task is not scoped for
+            processing, the list is returned unchanged.
 
+        Raises:
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination), or when circular dependencies are detected
+        """
+        if scope_cache is None:
+            scope_cache = dict()
+        task_names_in_preferred_processing_order = list(current_processing_order)
+        # Only the task names of the given order are known here, so their depths are not meaningful (and not returned)
+        depth = dict.fromkeys(task_names_in_preferred_processing_order, 0)
+        self._add_task_in_dependency_order(
+            task_names_in_order=task_names_in_preferred_processing_order,
+            depth=depth,
+            candidate_task_name=candidate_task_name,
+            command=command,
+            context=context,
+            scope_cache=scope_cache
+        )
         return task_names_in_preferred_processing_order
 
+    def _add_task_in_dependency_order(self, task_names_in_order: list, depth: dict, candidate_task_name: str, command: str, context: str, scope_cache: dict)->None:
+        """Appends a candidate task, preceded by all its (transitive) dependencies that were not yet ordered
+
+        The dependency tree is walked depth first, in the order in which the dependencies are listed, with an explicit
+        stack, so deep dependency chains are not limited by the Python recursion limit. Each task is appended right after
+        its own dependencies.
+
+        Args:
+            task_names_in_order: A list of task names already in processing order. Newly ordered task names are appended to it.
+            depth: A dict with the dependency depth of each task name in `task_names_in_order`. It is updated with the newly ordered task names.
+            candidate_task_name: The name of the task to add
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+            scope_cache: A dict used to remember the outcome of `task_scoped_for_processing()` calls
+
+        Raises:
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination), or when circular dependencies are detected
+        """
+        if candidate_task_name in depth:
+            return
+        if self._task_scoped_for_processing_cached(task_name=candidate_task_name, command=command, context=context, scope_cache=scope_cache) is False:
+            return
+
+        task_names_being_visited = {candidate_task_name}
+        dependency_task_names = self.get_task_dependencies_as_list_of_task_names(task_name=candidate_task_name, command=command, context=context, scope_cache=scope_cache)
+        stack = [(candidate_task_name, dependency_task_names, iter(dependency_task_names),)]
+        while len(stack) > 0:
+            task_name, dependency_task_names, remaining_dependency_task_names = stack[-1]
+            next_task_name = None
+            for dependant_task_name in remaining_dependency_task_names:
+                if dependant_task_name in depth:
+                    continue
+                if self._task_scoped_for_processing_cached(task_name=dependant_task_name, command=command, context=context, scope_cache=scope_cache) is False:
+                    continue
+                if dependant_task_name in task_names_being_visited:
+                    logger.critical('Circular dependency detected: task "{}" depends on task "{}". Unable to determine how to proceed - please resolve dependencies.'.format(task_name, dependant_task_name))
+                    raise Exception('Circular dependency detected: task "{}" depends on task "{}". Unable to determine how to proceed - please resolve dependencies.'.format(task_name, dependant_task_name))
+                next_task_name = dependant_task_name
+                break
+            if next_task_name is not None:
+                task_names_being_visited.add(next_task_name)
+                dependency_task_names = self.get_task_dependencies_as_list_of_task_names(task_name=next_task_name, command=command, context=context, scope_cache=scope_cache)
+                stack.append((next_task_name, dependency_task_names, iter(dependency_task_names),))
+                continue
+            stack.pop()
+            task_names_being_visited.discard(task_name)
+            depth[task_name] = max((depth[dependency_task_name] + 1 for dependency_task_name in dependency_task_names if dependency_task_name in depth), default=0)
+            task_names_in_order.append(task_name)
+
+    def _sort_tasks_topologically(self, command: str, context: str)->tuple:
+        """Sorts the tasks scoped for the given execution scope (command and context) by their dependencies
+
+        Tasks are taken in the order in which they were added, and each task is preceded by its (transitive) dependencies
+        that were not yet ordered. See `_add_task_in_dependency_order()`.
+
+        The result is cached per execution scope until the next task is added. Callers must therefore not modify the
+        returned list or dict.
+
+        Args:
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+
+        Returns:
+            A tuple with two items: a list of task names in processing order and a dict with the dependency depth of
+            each task name, where tasks without any dependencies have a depth of 0.
+
+        Raises:
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination), or when circular dependencies are detected
+        """
+        try:
+            return self._topological_sort_cache[(command, context)]
+        except KeyError:
+            pass
+
+        scope_cache = dict()
+        task_names_in_order = list()
+        depth = dict()
+        for task_name in self.get_task_names_scoped_for_processing(command=command, context=context, scope_cache=scope_cache):
+            self._add_task_in_dependency_order(task_names_in_order=task_names_in_order, depth=depth, candidate_task_name=task_name, command=command, context=context, scope_cache=scope_cache)
+        self._topological_sort_cache[(command, context)] = (task_names_in_order, depth)
+        return task_names_in_order, depth
+
     def get_task_names_in_order(self, command: str, context: str)->list:
         """Determines the correct order of task processing given an execution scope (command and context)
 
@@ -1104,26 +1630,46 @@ class Tasks(Sequence):
             A list of strings, where each string is the task name. The order of the list is important as it is determined by task dependencies such that the dependant tasks are listed first.
 
         Raises:
-            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination)
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination), or when circular dependencies are detected
         """
-        task_names_in_preferred_processing_order = list()
-        for task_name in list(self.tasks.keys()):
-            if task_name not in task_names_in_preferred_processing_order:
-                for task_name_in_order in  self._task_ordering(
-                    current_processing_order=copy.deepcopy(task_names_in_preferred_processing_order),
-                    candidate_task_name=task_name,
-                    command=command,
-                    context=context
-                ):
-                    if task_name_in_order not in task_names_in_preferred_processing_order:
-                        task_names_in_preferred_processing_order.append(task_name_in_order)
-                
-        return task_names_in_preferred_processing_order
+        task_names_in_order, depth = self._sort_tasks_topologically(command=command, context=context)
+        return list(task_names_in_order)
+
+    def get_task_names_in_dependency_levels(self, command: str, context: str)->list:
+        """Groups the tasks scoped for the given execution scope (command and context) by dependency depth
+
+        Tasks in the same group do not depend on each other and only depend on tasks in earlier groups, which means a
+        client could process all tasks of a group in parallel.
+
+        Args:
+            command: A string with the command of the execution scope
+            context: A string with the context of the execution scope
+
+        Returns:
+            A list of lists of task names. The first list contains the tasks without any dependencies.
+
+        Raises:
+            Exception: In scenarios where a dependant task may specifically excluded from the given scope (command and context combination), or when circular dependencies are detected
+        """
+        task_names_in_order, depth = self._sort_tasks_topologically(command=command, context=context)
+        levels = list()
+        for task_name in task_names_in_order:
+            while len(levels) <= depth[task_name]:
+                levels.append(list())
+            levels[depth[task_name]].append(task_name)
+        return levels
     
     def __getitem__(self, index):
-        keys = list(self.tasks.keys())
-        keys.sort()
-        return copy.deepcopy(self.get_task_instance_by_name(task_name=keys[index]))
+        if self._sorted_task_names is None:
+            self._sorted_task_names = sorted(self.tasks.keys())
+        return self.get_task_instance_by_name(task_name=self._sorted_task_names[index])
+
+    def __iter__(self):
+        # Walks the sorted task names directly, instead of the index probing (ending in an IndexError) of `Sequence`
+        if self._sorted_task_names is None:
+            self._sorted_task_names = sorted(self.tasks.keys())
+        for task_name in self._sorted_task_names:
+            yield copy.deepcopy(self.tasks[task_name]['TaskInstance'])
     
     def __len__(self) -> int:
         return len(self.tasks)
@@ -1157,6 +1703,8 @@ class TaskProcessor:
 
     def __init__(self, api_version: str) -> None:
         self.api_version = api_version
+        if isinstance(api_version, str) is True:
+            self.api_version = sys.intern(api_version)
 
     def create_identifier(self, task: Task, variable_name: str)->str:
         """Helper method to create a variable identifier.
@@ -1168,7 +1716,7 @@ class TaskProcessor:
         Returns:
             A string with the identifier.
         """
-        return '{}:{}'.format(task.task_id, variable_name)
+        return build_task_variable_name(task_id=task.task_id, variable_name=variable_name)
 
     def add_event(self, variable_store: VariableStore, task: Task, event_label: str='INFO_EVENT', event_description: str='No Details Provided')->VariableStore:
         """Adds an event entry to the `VariableStore` and ensures the event is captured in a consistent format.
@@ -1195,12 +1743,13 @@ class TaskProcessor:
             `create_identifier()` method, where the value of the `variable_name` is `PROCESSING_EVENTS`.
         """
         event_variable_name = self.create_identifier(task=task, variable_name='PROCESSING_EVENTS')
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
-        if event_variable_name not in variable_store.variable_store:
-            updated_variable_store = self.init_event_variable(variable_store=copy.deepcopy(updated_variable_store), task=task)
+        updated_variable_store = variable_store.clone()
+        if event_variable_name not in updated_variable_store.variable_store:
+            updated_variable_store = self.init_event_variable(variable_store=updated_variable_store, task=task)
+
+        # The cloned store owns its copy of the events list, so the new event is appended to it in place
         events: list
-        events = updated_variable_store.get_variable(variable_name=event_variable_name)
+        events = updated_variable_store.variable_store[event_variable_name]
         event_data = {
             'EventTimestamp': datetime.now(timezone.utc),
             'EventLabel': event_label,
@@ -1208,11 +1757,7 @@ class TaskProcessor:
             'TaskId': task.task_id,
         }
         events.append(event_data)
-        logger.info('EVENT: {}'.format(json.dumps(event_data, default=str)))
-        updated_variable_store = updated_variable_store.add_variable(
-            variable_name=event_variable_name,
-            value=copy.deepcopy(events)
-        )
+        logger.info('EVENT: {}'.format(log_json_encoder.encode(event_data)))
         return updated_variable_store
 
     def init_event_variable(self, variable_store: VariableStore, task: Task)->VariableStore:
@@ -1228,11 +1773,11 @@ class TaskProcessor:
         Returns:
             The updated `VariableStore` is returned.
         """
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
-        if self.create_identifier(task=task, variable_name='PROCESSING_EVENTS') not in updated_variable_store.variable_store:
+        updated_variable_store = variable_store.clone()
+        event_variable_name = self.create_identifier(task=task, variable_name='PROCESSING_EVENTS')
+        if event_variable_name not in updated_variable_store.variable_store:
             updated_variable_store = updated_variable_store.add_variable(
-                variable_name=self.create_identifier(task=task, variable_name='PROCESSING_EVENTS'),
+                variable_name=event_variable_name,
                 value=list()
             )
         return updated_variable_store
@@ -1280,70 +1825,70 @@ class TaskProcessor:
         Raises:
             Exception: Any exceptions raised in processing will be passed back to the client.
         """
-        variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='PROCESS_TASK_CALLED', event_description='Ready For Processing')
+        variable_store = self.add_event(variable_store=variable_store, task=task, event_label='PROCESS_TASK_CALLED', event_description='Ready For Processing')
         auto_rollback = task.auto_rollback_enabled()
         exception_raised = False
         final_exception_message = 'Unrecognized action "{}" provided'.format(action)
         if action == 'CreateAction':
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='CREATE_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='CREATE_ACTION_START', event_description='Start of processing')
             try:
-                variable_store = self.create_action(task=task, persistence=persistence, variable_store=copy.deepcopy(variable_store), task_resolved_spec=task_resolved_spec)
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='CREATE_ACTION_DONE', event_description='Start of processing')
+                variable_store = self.create_action(task=task, persistence=persistence, variable_store=variable_store.clone(), task_resolved_spec=task_resolved_spec)
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='CREATE_ACTION_DONE', event_description='Start of processing')
                 return variable_store
             except:
                 exception_text = traceback.format_exc()
                 logger.error('EXCEPTION: {}'.format(exception_text))
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='CREATE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='CREATE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
                 variable_store = variable_store.add_variable(variable_name='__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION', value='CreateAction')
                 exception_raised = True
                 final_exception_message = 'Action "CreateAction" failed with exception - please see logs for details.'
         elif action == 'DeleteAction':
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DELETE_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DELETE_ACTION_START', event_description='Start of processing')
             try:
                 variable_store = self.delete_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DELETE_ACTION_DONE', event_description='End of processing')
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DELETE_ACTION_DONE', event_description='End of processing')
                 return variable_store
             except:
                 exception_text = traceback.format_exc()
                 logger.error('EXCEPTION: {}'.format(exception_text))
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DELETE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DELETE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
                 variable_store = variable_store.add_variable(variable_name='__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION', value='DeleteAction')
                 exception_raised = True
                 final_exception_message = 'Action "DeleteAction" failed with exception - please see logs for details.'
         elif action == 'UpdateAction':
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='UPDATE_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='UPDATE_ACTION_START', event_description='Start of processing')
             try:
                 variable_store = self.update_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='UPDATE_ACTION_DONE', event_description='End of processing')
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='UPDATE_ACTION_DONE', event_description='End of processing')
                 return variable_store
             except:
                 exception_text = traceback.format_exc()
                 logger.error('EXCEPTION: {}'.format(exception_text))
-                variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='UPDATE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
+                variable_store = self.add_event(variable_store=variable_store, task=task, event_label='UPDATE_ACTION_ERROR', event_description='EXCEPTION: {}'.format(exception_text))
                 variable_store = variable_store.add_variable(variable_name='__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION', value='UpdateAction')
                 exception_raised = True
                 final_exception_message = 'Action "UpdateAction" failed with exception - please see logs for details.'
         elif action == 'DescribeAction':
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DESCRIBE_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DESCRIBE_ACTION_START', event_description='Start of processing')
             variable_store = self.describe_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DESCRIBE_ACTION_DONE', event_description='End of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DESCRIBE_ACTION_DONE', event_description='End of processing')
             return variable_store
         elif action == 'DetectDriftAction':
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DETECT_DRIFT_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DETECT_DRIFT_ACTION_START', event_description='Start of processing')
             variable_store = self.detect_drift_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='DETECT_DRIFT_ACTION_DONE', event_description='End of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='DETECT_DRIFT_ACTION_DONE', event_description='End of processing')
             return variable_store
         
         if action == 'RollbackAction' and exception_raised is False:
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='ROLLBACK_ACTION_START', event_description='Start of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='ROLLBACK_ACTION_START', event_description='Start of processing')
             variable_store = self.rollback_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='ROLLBACK_ACTION_DONE', event_description='End of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='ROLLBACK_ACTION_DONE', event_description='End of processing')
             return variable_store
         elif auto_rollback is True and action != 'RollbackAction' and exception_raised is True:
-            variable_store = variable_store.add_variable(variable_name='{}:RollbackFrom'.format(task.task_id), value=action)
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='ROLLBACK_ACTION_START', event_description='Start of processing')
+            variable_store = variable_store.add_variable(variable_name=build_task_variable_name(task_id=task.task_id, variable_name='RollbackFrom'), value=action)
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='ROLLBACK_ACTION_START', event_description='Start of processing')
             variable_store = self.rollback_action(task=task, persistence=persistence, variable_store=variable_store, task_resolved_spec=task_resolved_spec)
-            variable_store = self.add_event(variable_store=copy.deepcopy(variable_store), task=task, event_label='ROLLBACK_ACTION_DONE', event_description='End of processing')
+            variable_store = self.add_event(variable_store=variable_store, task=task, event_label='ROLLBACK_ACTION_DONE', event_description='End of processing')
             final_exception_message = '{} Auto Rollback action was attempted.'
 
         raise Exception(final_exception_message)
@@ -1523,12 +2068,18 @@ class Hook:
     )->VariableStore:
         """Main method for executing the `Hook`
 
+        The `VariableStore` passed in is not a copy: `WorkflowExecutor` passes the store returned by the previous `Hook`
+        straight to the next one, and also keeps references to the `PROCESSING_EVENTS` of each task. A `Hook` must
+        therefore not modify the given store or its values in place. Instead, build the updated store with
+        `variable_store.clone()` (or `variable_store.shallow_clone()` when only whole variables are added or replaced)
+        and return that, as the built-in hooks do.
+
         Args:
             task: The `Task` on which the `Hook` may need to work
             parameters: A dict with additional parameters. Each `Hook` implementation may require different parameters. The processing orchestration (i.e. `WorkflowExecutor`) must manage and set the appropriate parameters.
             parameter_validator: An instance of `ParameterValidation`
             persistence: The `StatePersistence` implementation for state persistence
-            variable_store: The current `VariableStore` instance
+            variable_store: The current `VariableStore` instance, shared with the caller, which must not be modified in place
             task_process_store: The `TaskProcessStore`, used to retrieve `TaskProcessor` instances for the `Task`, if required.
 
         Returns:
@@ -1564,9 +2115,10 @@ class TaskProcessingHook(Hook):
     )->VariableStore:
         task_processor = task_process_store.get_task_processor_for_task(task=task)
         task_resolved_spec = copy.deepcopy(task.spec)
-        if 'ResolvedSpec:{}'.format(task.task_id) in variable_store.variable_store:
-            task_resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(task.task_id)])
-        self._log(message='task_resolved_spec: {}'.format(json.dumps(task_resolved_spec, default=str)), task=task, level='debug')
+        resolved_spec_variable_name = 'ResolvedSpec:{}'.format(task.task_id)
+        if resolved_spec_variable_name in variable_store.variable_store:
+            task_resolved_spec = copy.deepcopy(variable_store.variable_store[resolved_spec_variable_name])
+        self._log(message='task_resolved_spec: {}'.format(log_json_encoder.encode(task_resolved_spec)), task=task, level='debug')
         if parameter_validator.validation_passed(parameters=parameters) is True:
             variable_store = task_processor.process_task(
                 task=task,
@@ -1663,54 +2215,27 @@ class ResolveTaskSpecVariablesHook(Hook):
         result = ''
         self._log(message='       raw_key: {}'.format(raw_key), task=task, level='debug')
         if raw_key.startswith('${VAR:'):                # ${VAR:MyId:SubKey1:SubKey2}        
-            key_parts = raw_key.split(':')              # ['${VAR', 'MyId', 'SubKey1', 'SubKey2}']
-            self._log(message='         key_parts      : {}'.format(key_parts), task=task, level='debug')
-            target_task_id = key_parts[1]               # MyId
-            target_index = ':'.join(key_parts[2:])      # SubKey1:SubKey2
-            target_index = target_index.replace('}', '')
+            target_task_id, target_index, potential_keys = build_variable_lookup_keys(raw_key=raw_key, command=command, context=context)
             self._log(message='         target_task_id : {}'.format(target_task_id), task=task, level='debug')
             self._log(message='         target_index   : {}'.format(target_index), task=task, level='debug')
-            potential_keys = list()
-            potential_keys.append(
-                '{}:{}:{}:{}'.format(       # MyId:a_command:a_context:SubKey1:SubKey2 - variable bound to command and context
-                    target_task_id,
-                    command,
-                    context,
-                    target_index
-                )
-            )
-            potential_keys.append(
-                '{}:{}::{}'.format(       # MyId:a_command:a_context:SubKey1:SubKey2 - variable bound to command bot not context
-                    target_task_id,
-                    command,
-                    target_index
-                )
-            )
-            potential_keys.append(
-                '{}::{}:{}'.format(       # MyId:a_command:a_context:SubKey1:SubKey2 - variable bound to context bot not command
-                    target_task_id,
-                    context,
-                    target_index
-                )
-            )
-            potential_keys.append(
-                '{}:{}'.format(             # MyId:SubKey1:SubKey2 - variable not bound to any command or context
-                    target_task_id,
-                    target_index
-                )
-            )
-
-            for lookup_key_base in potential_keys:
 
+            # Historically every potential key was matched against every variable name and the LAST match won. Walking
+            # both sequences in reverse and stopping at the first match selects exactly the same variable.
+            variable_names = list(variable_store.variable_store.keys())
+            variable_names.reverse()
+            resolved_key = None
+            for lookup_key_base in reversed(potential_keys):
                 self._log(message='         Looking for a key that looks like "{}" in key_value_store'.format(lookup_key_base), task=task, level='debug')
-                #self._log(message='           Potential keys: {}'.format(hook_name, list(variable_store.variable_store.keys())), task=task, level='debug')
-                for key in list(variable_store.variable_store.keys()):
-                    self._log(message='           Looking for key "{}" in "{}"'.format(lookup_key_base, key), task=task, level='debug')
+                for key in variable_names:
                     if lookup_key_base in key:
-                        self._log(message='              Resolved key "{}" to swap out for reference variable "{}"'.format(key, raw_key), task=task, level='info')
-                        result = copy.deepcopy(variable_store.variable_store[key])
-                    else:
-                        self._log(message='              Key "{}" Not Found'.format(lookup_key_base), task=task, level='info')
+                        resolved_key = key
+                        break
+                if resolved_key is not None:
+                    break
+                self._log(message='              Key "{}" Not Found'.format(lookup_key_base), task=task, level='info')
+            if resolved_key is not None:
+                self._log(message='              Resolved key "{}" to swap out for reference variable "{}"'.format(resolved_key, raw_key), task=task, level='info')
+                result = copy.deepcopy(variable_store.variable_store[resolved_key])
         else:
             raise Exception('Oops - the raw key is not what we expected: raw_key: "{}"'.format(raw_key))
         self._log(message='         Returning final result: "{}"'.format(result), task=task, level='debug')
@@ -1723,7 +2248,7 @@ class ResolveTaskSpecVariablesHook(Hook):
             return data
         modified_data = None
         if isinstance(data, str) is True:
-            modified_data: str = copy.deepcopy(data)
+            modified_data: str = data
             # matches = re.findall('(\$\{VAR:[\w|\-|\s|:|.|;|_]+\})', 'wc -l ${VAR:prompt_output_path:RESULT} > ${VAR:prompt_output_path:RESULT}_STATS && rm -vf ${VAR:prompt_output_2_path:RESULT}')
             # ['${VAR:prompt_output_path:RESULT}', '${VAR:prompt_output_path:RESULT}', '${VAR:prompt_output_2_path:RESULT}']
             matches = re.findall('(\$\{VAR:[\w|\-|\s|:|.|;|_]+\})', data)
@@ -1760,33 +2285,20 @@ class ResolveTaskSpecVariablesHook(Hook):
         variable_store: VariableStore=VariableStore(),
         task_process_store: TaskProcessStore=TaskProcessStore()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
-
-        command = 'none'
-        context = 'none'
-
-        if 'Command' in parameters:
-            if parameters['Command'] is not None:
-                if isinstance(parameters['Command'], str) is True:
-                    if len(parameters['Command']) > 0:
-                        command = parameters['Command']
-        if 'Context' in parameters:
-            if parameters['Context'] is not None:
-                if isinstance(parameters['Context'], str) is True:
-                    if len(parameters['Context']) > 0:
-                        context = parameters['Context']
-
-        updated_variable_store.add_variable(
-            variable_name='ResolvedSpec:{}'.format(task.task_id),
-            value=self._analyse_data(
-                task=task,
-                data=copy.deepcopy(task.spec),
-                variable_store=variable_store,
-                command=command,
-                context=context
-            )
-        ) 
+        updated_variable_store = variable_store.shallow_clone()
+
+        command = extract_string_parameter(parameters=parameters, parameter_name='Command', default='none')
+        context = extract_string_parameter(parameters=parameters, parameter_name='Context', default='none')
+
+        # _analyse_data() builds a new structure in a single walk over the spec (copying only values it does not
+        # rebuild), so neither the input spec nor the result needs to be deep copied
+        updated_variable_store.variable_store['ResolvedSpec:{}'.format(task.task_id)] = self._analyse_data(
+            task=task,
+            data=task.spec,
+            variable_store=variable_store,
+            command=command,
+            context=context
+        )
         return updated_variable_store
 
 
@@ -1815,7 +2327,7 @@ class TaskPostProcessingStateUpdateHook(Hook):
     updated_variable_store.add_variable(
         variable_name=self.create_identifier(task=task, variable_name='TASK_STATE_UPDATES'),
         value={
-            'resource_checksum': hashlib.sha256(calculated_resource_string.encode('utf-8')).hexdigest(),
+            'resource_checksum': calculate_string_checksum(value=calculated_resource_string),
             'resolved_spec_applied': copy.deepcopy(task_resolved_spec),
             'state_changed': True,
             'is_created': True,
@@ -1839,10 +2351,18 @@ class TaskPostProcessingStateUpdateHook(Hook):
         }
     )
     ```
+
+    Updated state is only added to the `StatePersistence` cache. The `WorkflowExecutor` calls `StatePersistence.commit()`
+    once after all tasks were processed. When this hook is used outside of a `WorkflowExecutor`, or when state must be
+    committed after every task, set `commit_after_update` to `True`.
+
+    Attributes:
+        commit_after_update: A boolean (default=False). If `True`, `StatePersistence.commit()` is called after every state update
     """
 
-    def __init__(self, name: str='TaskPostProcessingStateUpdateHook'):
+    def __init__(self, name: str='TaskPostProcessingStateUpdateHook', commit_after_update: bool=False):
         super().__init__(name)
+        self.commit_after_update = commit_after_update
 
     def _validate_data(self, data: dict)->bool:
         expected_data = {
@@ -1897,10 +2417,9 @@ class TaskPostProcessingStateUpdateHook(Hook):
         variable_store: VariableStore=VariableStore(),
         task_process_store: TaskProcessStore=TaskProcessStore()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.clone()
 
-        vs_key = '{}:TASK_STATE_UPDATES'.format(task.task_id)
+        vs_key = build_task_variable_name(task_id=task.task_id, variable_name='TASK_STATE_UPDATES')
         if vs_key not in updated_variable_store.variable_store:
             logger.warning('No TASK_STATE_UPDATES variable detected - state will NOT be updated and persisted')
             return updated_variable_store
@@ -1926,13 +2445,14 @@ class TaskPostProcessingStateUpdateHook(Hook):
         )
 
         persistence.update_object_state(
-            object_identifier='{}:TASK_STATE'.format(task.task_id),
+            object_identifier=build_task_variable_name(task_id=task.task_id, variable_name='TASK_STATE'),
             data=task.state.to_dict(
                 with_checksums=True,
                 include_applied_spec=True
             )
         )
-        persistence.commit()
+        if self.commit_after_update is True:
+            persistence.commit()
 
         return updated_variable_store
 
@@ -1976,8 +2496,7 @@ class GeneralErrorHook(Hook):
             non_critical_error_message = variable_store.variable_store.pop('__GLOBAL__:NoneCriticalErrorMessage')
             error_message = 'task="{}"\n\terror: {}\n\tNOTE: Error in non-critical and therefore no exception will be raised.'.format(task_name, non_critical_error_message)
         logger.error('ERROR:\n\t{}'.format(error_message))
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.clone()
         return updated_variable_store
 
 
@@ -2275,6 +2794,17 @@ class WorkflowExecutor:
         processing is done, and assuming there are no exceptions raised in the process, the final updated
         `VariableStore` will be returned to the client.
 
+        `StatePersistence.commit()` is called once all tasks were processed, or when processing fails, before the
+        exception is raised, so that the state of tasks processed before the failure is not lost.
+
+        The `VariableStore` returned by one `Hook` is passed to the next without copying it. See `Hook.run()` for what
+        this means for `Hook` implementations.
+
+        Tasks are processed one at a time, because each `Hook` receives the `VariableStore` returned by the previous
+        `Hook` and a task may reference variables produced by any task processed before it. Clients that know their
+        tasks to be independent can use `Tasks.get_task_names_in_dependency_levels()` to find groups of tasks that
+        could be processed in parallel.
+
         Args:
             command: A string with the desired command to run on all `Tasks`
             context: A string with the desired context
@@ -2287,6 +2817,9 @@ class WorkflowExecutor:
         """
         if len(self.ordered_workflow_steps) == 0:
             raise Exception('No steps to execute')
+
+        # This is the only copy made of the initial variable store - every hook receives the store returned by the
+        # previous hook, which is private to this workflow execution.
         updated_variable_store = copy.deepcopy(self.variable_store)
 
         if command not in self.command_to_action_map:
@@ -2302,6 +2835,7 @@ class WorkflowExecutor:
         task_name: str
         for task_name in self.tasks.get_task_names_in_order(command=command, context=context):
             task = self.tasks.get_task_instance_by_name(task_name=task_name)
+            processing_events_key = build_task_variable_name(task_id=task.task_id, variable_name='PROCESSING_EVENTS')
             hook: Hook
             for hook in self.ordered_workflow_steps:
                 try:
@@ -2311,11 +2845,11 @@ class WorkflowExecutor:
                         parameters=parameters,
                         parameter_validator=self.parameter_validator,
                         persistence=self.persistence,
-                        variable_store=copy.deepcopy(updated_variable_store),
+                        variable_store=updated_variable_store,
                         task_process_store=self.task_process_store
                     )
-                    if '{}:PROCESSING_EVENTS'.format(task.task_id) in updated_variable_store.variable_store:
-                        all_events += copy.deepcopy(updated_variable_store.variable_store['{}:PROCESSING_EVENTS'.format(task.task_id)])
+                    if processing_events_key in updated_variable_store.variable_store:
+                        all_events += updated_variable_store.variable_store[processing_events_key]
                 except:
                     exception_stacktrace = traceback.format_exc()
                     logger.error('EXCEPTION: {}'.format(exception_stacktrace))
@@ -2333,7 +2867,9 @@ class WorkflowExecutor:
                             )
                     else:
                         print(exception_stacktrace) # pragma: no cover
+                    # Persist the state of the tasks that were processed before the failure
+                    self.persistence.commit()
                     raise Exception('Failure to process hook "{}" - cannot continue'.format(hook.name))
         self.persistence.commit()
-        return copy.deepcopy(updated_variable_store)
+        return updated_variable_store
 
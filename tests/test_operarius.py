@@ -1,7 +1,7 @@
 import sys
 import os
-import hashlib
 from inspect import stack
+from collections import deque
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
 print('sys.path={}'.format(sys.path))
@@ -14,116 +14,103 @@ running_path = os.getcwd()
 print('Current Working Path: {}'.format(running_path))
 
 
+# Only the most recent log lines are kept, to bound memory use over long test runs
+TEST_LOGGER_MAX_LINES = 10000
+
+
 class TestLogger:   # pragma: no cover
 
+    __slots__ = ('info_lines', 'warn_lines', 'debug_lines', 'critical_lines', 'error_lines', 'all_lines_in_sequence',)
+
     def __init__(self):
-        super().__init__()
-        self.info_lines = list()
-        self.warn_lines = list()
-        self.debug_lines = list()
-        self.critical_lines = list()
-        self.error_lines = list()
-        self.all_lines_in_sequence = list()
+        self.info_lines = deque(maxlen=TEST_LOGGER_MAX_LINES)
+        self.warn_lines = deque(maxlen=TEST_LOGGER_MAX_LINES)
+        self.debug_lines = deque(maxlen=TEST_LOGGER_MAX_LINES)
+        self.critical_lines = deque(maxlen=TEST_LOGGER_MAX_LINES)
+        self.error_lines = deque(maxlen=TEST_LOGGER_MAX_LINES)
+        self.all_lines_in_sequence = deque(maxlen=TEST_LOGGER_MAX_LINES)
+
+    def _record(self, level_lines: deque, level: str, message: str):
+        line = '[LOG] {}: {}'.format(level, message)
+        level_lines.append(line)
+        self.all_lines_in_sequence.append(line)
 
     def info(self, message: str):
-        self.info_lines.append('[LOG] INFO: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.info_lines[-1])
-        )
+        self._record(level_lines=self.info_lines, level='INFO', message=message)
 
     def warn(self, message: str):
-        self.warn_lines.append('[LOG] WARNING: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.warn_lines[-1])
-        )
+        self._record(level_lines=self.warn_lines, level='WARNING', message=message)
 
     def warning(self, message: str):
-        self.warn_lines.append('[LOG] WARNING: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.warn_lines[-1])
-        )
+        self._record(level_lines=self.warn_lines, level='WARNING', message=message)
 
     def debug(self, message: str):
-        self.debug_lines.append('[LOG] DEBUG: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.debug_lines[-1])
-        )
+        self._record(level_lines=self.debug_lines, level='DEBUG', message=message)
 
     def critical(self, message: str):
-        self.critical_lines.append('[LOG] CRITICAL: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.critical_lines[-1])
-        )
+        self._record(level_lines=self.critical_lines, level='CRITICAL', message=message)
 
     def error(self, message: str):
-        self.error_lines.append('[LOG] ERROR: {}'.format(message))
-        self.all_lines_in_sequence.append(
-            copy.deepcopy(self.error_lines[-1])
-        )
+        self._record(level_lines=self.error_lines, level='ERROR', message=message)
 
     def reset(self):
-        self.info_lines = None
-        self.warn_lines = None
-        self.debug_lines = None
-        self.critical_lines = None
-        self.error_lines = None
-        self.all_lines_in_sequence = None
-        self.info_lines = list()
-        self.warn_lines = list()
-        self.debug_lines = list()
-        self.critical_lines = list()
-        self.error_lines = list()
-        self.all_lines_in_sequence = list()
+        self.info_lines.clear()
+        self.warn_lines.clear()
+        self.debug_lines.clear()
+        self.critical_lines.clear()
+        self.error_lines.clear()
+        self.all_lines_in_sequence.clear()
         print('*** LOGGER RESET DONE ***')
 
 
 def print_logger_lines(logger:TestLogger):  # pragma: no cover
-    print('\n\n-------------------------------------------------------------------------------')
-    print('\t\tLOG DUMP')
-    print('\t\t-------------------')
-    for line in logger.all_lines_in_sequence:
-        print(line)
-    print('\n_______________________________________________________________________________')
+    # Each dump is written with a single print() call
+    lines = [
+        '\n\n-------------------------------------------------------------------------------',
+        '\t\tLOG DUMP',
+        '\t\t-------------------',
+    ]
+    lines.extend(logger.all_lines_in_sequence)
+    lines.append('\n_______________________________________________________________________________')
+    print('\n'.join(lines))
 
 
 def dump_variable_store(test_class_name: str, test_method_name: str, variable_store: VariableStore):
     try:
-        print('\n\n-------------------------------------------------------------------------------')
-        print('\t\tVARIABLE STORE DUMP')
-        print('\t\t-------------------')
-        print('\t\tTest Class  : {}'.format(test_class_name))
-        print('\t\tTest Method : {}'.format(test_method_name))
-        print()
+        lines = [
+            '\n\n-------------------------------------------------------------------------------',
+            '\t\tVARIABLE STORE DUMP',
+            '\t\t-------------------',
+            '\t\tTest Class  : {}'.format(test_class_name),
+            '\t\tTest Method : {}'.format(test_method_name),
+            '',
+        ]
 
         # First get the max key length:
-        max_key_len = 0
-        for key,val in variable_store.variable_store.items():
-            if len(key) > max_key_len:
-                max_key_len = len(key)
+        max_key_len = max(map(len, variable_store.variable_store), default=0)
 
         for key,val in variable_store.variable_store.items():
-            final_key = '{}'.format(key)
-            spaces_qty = max_key_len - len(final_key) + 1
-            spaces = ' '*spaces_qty
-            final_key = '{}{}: '.format(final_key, spaces)
-            print('{}{}\n'.format(final_key, val))
+            final_key = '{}: '.format('{}'.format(key).ljust(max_key_len + 1))
+            lines.append('{}{}\n'.format(final_key, val))
 
-        print('\n_______________________________________________________________________________')
+        lines.append('\n_______________________________________________________________________________')
+        print('\n'.join(lines))
     except:
         pass
 
 
 def dump_events(task_id: str, variable_store: VariableStore):   # pragma: no cover
-    print('\n\n-------------------------------------------------------------------------------')
-    print('\t\tEVENTS for task  : {}'.format(task_id))
-    print()
-    event_key = '{}:PROCESSING_EVENTS'.format(task_id)
-    if event_key in variable_store.variable_store:
-        if variable_store.variable_store[event_key] is not None:
-            if isinstance(variable_store.variable_store[event_key], list):
-                for event in variable_store.variable_store[event_key]:
-                    print(json.dumps(event, default=str))
-    print('\n_______________________________________________________________________________')
+    lines = [
+        '\n\n-------------------------------------------------------------------------------',
+        '\t\tEVENTS for task  : {}'.format(task_id),
+        '',
+    ]
+    events = variable_store.variable_store.get('{}:PROCESSING_EVENTS'.format(task_id))
+    if isinstance(events, list):
+        for event in events:
+            lines.append(log_json_encoder.encode(event))
+    lines.append('\n_______________________________________________________________________________')
+    print('\n'.join(lines))
 
 
 def dump_state(task: Task, persistence: StatePersistence):   # pragma: no cover
@@ -143,10 +130,34 @@ logger = test_logger
 override_logger(logger_class=test_logger)
 
 
+# The summary produced by TaskState.to_dict() without checksums is a subset of the output with checksums
+HUMAN_READABLE_SUMMARY_KEYS = ('Label', 'IsCreated', 'CreatedTimestamp', 'SpecDrifted', 'ResourceDrifted',)
+
+# Resource checksum used when no ResourceData variable was set for a task
+DEFAULT_RESOURCE_CHECKSUM = calculate_string_checksum(value='test_resource')
+
+# Applied resource checksum used to set up the drift detection tests
+TEST_RESOURCE_ORIGINAL_CHECKSUM = calculate_string_checksum(value='test_resource_original')
+
+
 class DummyTaskProcessor1(TaskProcessor):
 
     def __init__(self, api_version: str='DummyTaskProcessor1/v1') -> None:
         super().__init__(api_version)
+        self._checksum_cache = dict()
+
+    def _cached_checksum(self, value: str)->str:
+        digest = self._checksum_cache.get(value)
+        if digest is None:
+            digest = calculate_string_checksum(value=value)
+            self._checksum_cache[value] = digest
+        return digest
+
+    def _resource_checksum(self, task: Task, variable_store: VariableStore)->str:
+        resource_data = variable_store.variable_store.get('ResourceData:{}'.format(task.task_id))
+        if resource_data is None:
+            return DEFAULT_RESOURCE_CHECKSUM
+        return self._cached_checksum(value=resource_data)
 
     def create_action(
         self,
@@ -155,38 +166,36 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.shallow_clone()
+        throw_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')
+        processing_events_variable_name = self.create_identifier(task=task, variable_name='PROCESSING_EVENTS')
+        force_processing_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_FORCE_PROCESSING_EXCEPTION')
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION') in updated_variable_store.variable_store:
-            if updated_variable_store.get_variable(variable_name=self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')) is True:
-                raise Exception('CreateAction Failed!')
+        if updated_variable_store.variable_store.get(throw_exception_variable_name) is True:
+            raise Exception('CreateAction Failed!')
 
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM'),
-            value=hashlib.sha256(json.dumps(task.spec, default=str).encode('utf-8')).hexdigest()
+            value=self._cached_checksum(value=task.spec_json)
         )
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_RESOLVED_SPEC_CHECKSUM'),
-            value=hashlib.sha256(json.dumps(task_resolved_spec, default=str).encode('utf-8')).hexdigest()
+            value=self._cached_checksum(value=checksum_json_encoder_with_str_default.encode(task_resolved_spec))
         )
 
-        if self.create_identifier(task=task, variable_name='PROCESSING_EVENTS') not in variable_store.variable_store:
+        if processing_events_variable_name not in variable_store:
             updated_variable_store.add_variable(
-                variable_name=self.create_identifier(task=task, variable_name='PROCESSING_EVENTS'),
+                variable_name=processing_events_variable_name,
                 value=list()
             )
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_FORCE_PROCESSING_EXCEPTION') in variable_store.variable_store:
-            if variable_store.variable_store[self.create_identifier(task=task, variable_name='UNITTEST_FORCE_PROCESSING_EXCEPTION')] is not None:
-                if isinstance(variable_store.variable_store[self.create_identifier(task=task, variable_name='UNITTEST_FORCE_PROCESSING_EXCEPTION')], bool):
-                    if variable_store.variable_store[self.create_identifier(task=task, variable_name='UNITTEST_FORCE_PROCESSING_EXCEPTION')] is True:
-                        raise Exception('Exception Forced By Unit Test Configuration')
+        if variable_store.variable_store.get(force_processing_exception_variable_name) is True:
+            raise Exception('Exception Forced By Unit Test Configuration')
         
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_STATE_UPDATES'),
             value={
-                'resource_checksum': hashlib.sha256('CreateAction for UnitTest Completed'.encode('utf-8')).hexdigest(),
+                'resource_checksum': calculate_string_checksum(value='CreateAction for UnitTest Completed'),
                 'resolved_spec_applied': copy.deepcopy(task_resolved_spec),
                 'state_changed': True,
                 'is_created': True,
@@ -205,26 +214,22 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
-        if self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM') in updated_variable_store.variable_store:
-            updated_variable_store = self.delete_action(
+        # delete_action() and create_action() clone the store themselves, so it is only cloned here when neither runs
+        if self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM') in variable_store:
+            return self.delete_action(
                 task=task,
                 persistence=persistence,
-                variable_store=copy.deepcopy(updated_variable_store),
+                variable_store=variable_store,
                 task_resolved_spec=task_resolved_spec
             )
-        else:
-            if '__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION' in updated_variable_store.variable_store:
-                if updated_variable_store.get_variable(variable_name='__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION') == 'CreateAction':
-                    return updated_variable_store 
-            updated_variable_store = self.create_action(
-                task=task,
-                persistence=persistence,
-                variable_store=copy.deepcopy(updated_variable_store),
-                task_resolved_spec=task_resolved_spec
-            )
-        return updated_variable_store
+        if variable_store.variable_store.get('__GLOBAL__:PROCESS_TASK_EXCEPTION_RAISED_FOR_ACTION') == 'CreateAction':
+            return variable_store.shallow_clone()
+        return self.create_action(
+            task=task,
+            persistence=persistence,
+            variable_store=variable_store,
+            task_resolved_spec=task_resolved_spec
+        )
     
     def delete_action(
         self,
@@ -233,17 +238,16 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.shallow_clone()
+        throw_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION') in updated_variable_store.variable_store:
-            if updated_variable_store.get_variable(variable_name=self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')) is True:
-                raise Exception('DeleteAction Failed!')
+        if updated_variable_store.variable_store.get(throw_exception_variable_name) is True:
+            raise Exception('DeleteAction Failed!')
         
-        if self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM') in updated_variable_store.variable_store:
-            updated_variable_store.variable_store.pop(self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM'))
-        if self.create_identifier(task=task, variable_name='TASK_RESOLVED_SPEC_CHECKSUM') in updated_variable_store.variable_store:
-            updated_variable_store.variable_store.pop(self.create_identifier(task=task, variable_name='TASK_RESOLVED_SPEC_CHECKSUM'))
+        original_spec_checksum_variable_name = self.create_identifier(task=task, variable_name='TASK_ORIGINAL_SPEC_CHECKSUM')
+        resolved_spec_checksum_variable_name = self.create_identifier(task=task, variable_name='TASK_RESOLVED_SPEC_CHECKSUM')
+        updated_variable_store.variable_store.pop(original_spec_checksum_variable_name, None)
+        updated_variable_store.variable_store.pop(resolved_spec_checksum_variable_name, None)
         
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_STATE_UPDATES'),
@@ -267,17 +271,16 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.shallow_clone()
+        throw_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION') in updated_variable_store.variable_store:
-            if updated_variable_store.get_variable(variable_name=self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')) is True:
-                raise Exception('DeleteAction Failed!')
+        if updated_variable_store.variable_store.get(throw_exception_variable_name) is True:
+            raise Exception('DeleteAction Failed!')
         
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_STATE_UPDATES'),
             value={
-                'resource_checksum': hashlib.sha256('UpdateAction for UnitTest Completed'.encode('utf-8')).hexdigest(),
+                'resource_checksum': calculate_string_checksum(value='UpdateAction for UnitTest Completed'),
                 'resolved_spec_applied': copy.deepcopy(task_resolved_spec),
                 'state_changed': True,
                 'is_created': True,
@@ -296,53 +299,37 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.shallow_clone()
+        throw_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION') in updated_variable_store.variable_store:
-            if updated_variable_store.get_variable(variable_name=self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')) is True:
-                raise Exception('UpdateAction Failed!')
+        if updated_variable_store.variable_store.get(throw_exception_variable_name) is True:
+            raise Exception('UpdateAction Failed!')
         
-        resource_checksum = hashlib.sha256('test_resource'.encode('utf-8')).hexdigest()
-        if 'ResourceData:{}'.format(task.task_id) in variable_store.variable_store:
-            resource_checksum = hashlib.sha256(
-                variable_store.variable_store['ResourceData:{}'.format(task.task_id)].encode('utf-8')
-            ).hexdigest()
+        resource_checksum = self._resource_checksum(task=task, variable_store=variable_store)
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_DESCRIPTION_RAW'),
-            value=copy.deepcopy(
-                task.state.to_dict(
-                    human_readable=False,
-                    current_resolved_spec=task_resolved_spec,
-                    current_resource_checksum=resource_checksum,
-                    with_checksums=True,
-                    include_applied_spec=True
-                )
+            value=task.state.to_dict(
+                human_readable=False,
+                current_resolved_spec=task_resolved_spec,
+                current_resource_checksum=resource_checksum,
+                with_checksums=True,
+                include_applied_spec=True
             )
         )
+        human_readable_extended = task.state.to_dict(
+            human_readable=True,
+            current_resolved_spec=task_resolved_spec,
+            current_resource_checksum=resource_checksum,
+            with_checksums=True,
+            include_applied_spec=False
+        )
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_DESCRIPTION_HUMAN_READABLE_SUMMARY'),
-            value=copy.deepcopy(
-                task.state.to_dict(
-                    human_readable=True,
-                    current_resolved_spec=task_resolved_spec,
-                    current_resource_checksum=resource_checksum,
-                    with_checksums=False,
-                    include_applied_spec=False
-                )
-            )
+            value=dict((key, human_readable_extended[key]) for key in HUMAN_READABLE_SUMMARY_KEYS)
         )
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='TASK_DESCRIPTION_HUMAN_READABLE_EXTENDED'),
-            value=copy.deepcopy(
-                task.state.to_dict(
-                    human_readable=True,
-                    current_resolved_spec=task_resolved_spec,
-                    current_resource_checksum=resource_checksum,
-                    with_checksums=True,
-                    include_applied_spec=False
-                )
-            )
+            value=human_readable_extended
         )
         return updated_variable_store
     
@@ -353,18 +340,13 @@ class DummyTaskProcessor1(TaskProcessor):
         variable_store: VariableStore=VariableStore(),
         task_resolved_spec: dict=dict()
     )->VariableStore:
-        updated_variable_store = VariableStore()
-        updated_variable_store.variable_store = copy.deepcopy(variable_store.variable_store)
+        updated_variable_store = variable_store.shallow_clone()
+        throw_exception_variable_name = self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')
 
-        if self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION') in updated_variable_store.variable_store:
-            if updated_variable_store.get_variable(variable_name=self.create_identifier(task=task, variable_name='UNITTEST_TROW_EXCEPTION')) is True:
-                raise Exception('DetectDriftAction Failed!')
+        if updated_variable_store.variable_store.get(throw_exception_variable_name) is True:
+            raise Exception('DetectDriftAction Failed!')
         
-        resource_checksum = hashlib.sha256('test_resource'.encode('utf-8')).hexdigest()
-        if 'ResourceData:{}'.format(task.task_id) in variable_store.variable_store:
-            resource_checksum = hashlib.sha256(
-                variable_store.variable_store['ResourceData:{}'.format(task.task_id)].encode('utf-8')
-            ).hexdigest()
+        resource_checksum = self._resource_checksum(task=task, variable_store=variable_store)
 
         current_task_state = task.state.to_dict(
             human_readable=False,
@@ -375,14 +357,9 @@ class DummyTaskProcessor1(TaskProcessor):
         )
         spec_drifted = False
         resource_drifted = False
-        if 'IsCreated' in current_task_state:
-            if isinstance(current_task_state['IsCreated'], bool):
-                if current_task_state['IsCreated'] is True:
-                    if 'SpecDrifted' in current_task_state and 'ResourceDrifted' in current_task_state:
-                        if isinstance(current_task_state['SpecDrifted'], bool):
-                            spec_drifted = current_task_state['SpecDrifted']
-                        if isinstance(current_task_state['ResourceDrifted'], bool):
-                            resource_drifted = current_task_state['ResourceDrifted']
+        if current_task_state.get('IsCreated') is True:
+            spec_drifted = current_task_state.get('SpecDrifted') is True
+            resource_drifted = current_task_state.get('ResourceDrifted') is True
 
         updated_variable_store.add_variable(
             variable_name=self.create_identifier(task=task, variable_name='SPEC_DRIFTED'),
@@ -408,25 +385,36 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
             spec={'testField': 'testValue'}
         )
 
+    def _create_drift_test_task_state(self, applied_spec: dict, applied_resources_checksum: str)->TaskState:
+        return TaskState(
+            report_label=self.task.task_id,
+            manifest_spec=dict(self.task.spec),
+            manifest_metadata=dict(self.task.metadata),
+            applied_spec=applied_spec,
+            resolved_spec=dict(self.task.spec),
+            created_timestamp=1000,
+            applied_resources_checksum=applied_resources_checksum
+        )
+
     def test_create_action_01(self):
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
+        t = self.task
         variable_store = p.process_task(
             task=t,
             variable_store=VariableStore(),
             action='CreateAction',
-            task_resolved_spec=copy.deepcopy(t.spec)
+            task_resolved_spec=t.spec
         )
 
         print_logger_lines(logger=logger)
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -440,14 +428,14 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
 
     def test_describe_action_01(self):
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
+        t = self.task
         variable_store = VariableStore()
-        resolved_spec = copy.deepcopy(self.task.spec)
+        resolved_spec = self.task.spec
         if 'ResolvedSpec:{}'.format(self.task.task_id) in variable_store.variable_store:
-            resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)])
+            resolved_spec = variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)]
         variable_store = p.process_task(
             task=t,
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             action='DescribeAction',
             task_resolved_spec=resolved_spec
         )
@@ -460,7 +448,7 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -472,27 +460,22 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
     def test_drift_action_no_drift_detected_01(self):
         
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
-        t.state = TaskState(
-            report_label=copy.deepcopy(t.task_id),
-            manifest_spec=copy.deepcopy(t.spec),
-            manifest_metadata=copy.deepcopy(t.metadata),
-            applied_spec=copy.deepcopy(t.spec),
-            resolved_spec=copy.deepcopy(t.spec),
-            created_timestamp=1000, 
-            applied_resources_checksum=hashlib.sha256('test_resource'.encode('utf-8')).hexdigest()
+        t = self.task
+        t.state = self._create_drift_test_task_state(
+            applied_spec=dict(t.spec),
+            applied_resources_checksum=DEFAULT_RESOURCE_CHECKSUM
         )
         variable_store = VariableStore()
         variable_store.add_variable(
             variable_name='ResourceData:{}'.format(t.task_id),
             value='test_resource'
         )
-        resolved_spec = copy.deepcopy(self.task.spec)
+        resolved_spec = self.task.spec
         if 'ResolvedSpec:{}'.format(self.task.task_id) in variable_store.variable_store:
-            resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)])
+            resolved_spec = variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)]
         variable_store = p.process_task(
             task=t,
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             action='DetectDriftAction',
             task_resolved_spec=resolved_spec
         )
@@ -505,7 +488,7 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -521,27 +504,22 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
     def test_drift_action_only_resource_drift_detected_01(self):
         
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
-        t.state = TaskState(
-            report_label=copy.deepcopy(t.task_id),
-            manifest_spec=copy.deepcopy(t.spec),
-            manifest_metadata=copy.deepcopy(t.metadata),
-            applied_spec=copy.deepcopy(t.spec),
-            resolved_spec=copy.deepcopy(t.spec),
-            created_timestamp=1000, 
-            applied_resources_checksum=hashlib.sha256('test_resource_original'.encode('utf-8')).hexdigest()
+        t = self.task
+        t.state = self._create_drift_test_task_state(
+            applied_spec=dict(t.spec),
+            applied_resources_checksum=TEST_RESOURCE_ORIGINAL_CHECKSUM
         )
         variable_store = VariableStore()
         variable_store.add_variable(
             variable_name='ResourceData:{}'.format(t.task_id),
             value='test_resource'
         )
-        resolved_spec = copy.deepcopy(self.task.spec)
+        resolved_spec = self.task.spec
         if 'ResolvedSpec:{}'.format(self.task.task_id) in variable_store.variable_store:
-            resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)])
+            resolved_spec = variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)]
         variable_store = p.process_task(
             task=t,
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             action='DetectDriftAction',
             task_resolved_spec=resolved_spec
         )
@@ -554,7 +532,7 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -569,27 +547,22 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
     def test_drift_action_only_spec_drift_detected_01(self):
         
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
-        t.state = TaskState(
-            report_label=copy.deepcopy(t.task_id),
-            manifest_spec=copy.deepcopy(t.spec),
-            manifest_metadata=copy.deepcopy(t.metadata),
+        t = self.task
+        t.state = self._create_drift_test_task_state(
             applied_spec={'originalField': 'originalValue'},
-            resolved_spec=copy.deepcopy(t.spec),
-            created_timestamp=1000, 
-            applied_resources_checksum=hashlib.sha256('test_resource'.encode('utf-8')).hexdigest()
+            applied_resources_checksum=DEFAULT_RESOURCE_CHECKSUM
         )
         variable_store = VariableStore()
         variable_store.add_variable(
             variable_name='ResourceData:{}'.format(t.task_id),
             value='test_resource'
         )
-        resolved_spec = copy.deepcopy(self.task.spec)
+        resolved_spec = self.task.spec
         if 'ResolvedSpec:{}'.format(self.task.task_id) in variable_store.variable_store:
-            resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)])
+            resolved_spec = variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)]
         variable_store = p.process_task(
             task=t,
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             action='DetectDriftAction',
             task_resolved_spec=resolved_spec
         )
@@ -602,7 +575,7 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -617,27 +590,22 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
     def test_drift_action_resource_and_spec_drift_detected_01(self):
         
         p = DummyTaskProcessor1()
-        t = copy.deepcopy(self.task)
-        t.state = TaskState(
-            report_label=copy.deepcopy(t.task_id),
-            manifest_spec=copy.deepcopy(t.spec),
-            manifest_metadata=copy.deepcopy(t.metadata),
+        t = self.task
+        t.state = self._create_drift_test_task_state(
             applied_spec={'originalField': 'originalValue'},
-            resolved_spec=copy.deepcopy(t.spec),
-            created_timestamp=1000, 
-            applied_resources_checksum=hashlib.sha256('test_resource_original'.encode('utf-8')).hexdigest()
+            applied_resources_checksum=TEST_RESOURCE_ORIGINAL_CHECKSUM
         )
         variable_store = VariableStore()
         variable_store.add_variable(
             variable_name='ResourceData:{}'.format(t.task_id),
             value='test_resource'
         )
-        resolved_spec = copy.deepcopy(self.task.spec)
+        resolved_spec = self.task.spec
         if 'ResolvedSpec:{}'.format(self.task.task_id) in variable_store.variable_store:
-            resolved_spec = copy.deepcopy(variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)])
+            resolved_spec = variable_store.variable_store['ResolvedSpec:{}'.format(self.task.task_id)]
         variable_store = p.process_task(
             task=t,
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             action='DetectDriftAction',
             task_resolved_spec=resolved_spec
         )
@@ -650,7 +618,7 @@ class TestDummyTaskProcessor1(unittest.TestCase):    # pragma: no cover
         )
         dump_events(
             task_id=t.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -761,8 +729,8 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
         result = tasks.get_task_names_in_order(command='command1', context='con1')
 
         print_logger_lines(logger=logger)
@@ -802,9 +770,7 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             },
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_tasks(tasks=[self.task_02, self.task_03, self.task_01,])
         result = tasks.get_task_names_in_order(command='command2', context='con2')
 
         print_logger_lines(logger=logger)
@@ -845,9 +811,7 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             },
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_tasks(tasks=[self.task_02, self.task_03, self.task_01,])
         result = tasks.get_task_names_in_order(command='command1', context='con1')
 
         print_logger_lines(logger=logger)
@@ -893,9 +857,7 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             },
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_tasks(tasks=[self.task_02, self.task_03, self.task_01,])
         result = None
         with self.assertRaises(Exception):
             result = tasks.get_task_names_in_order(command='command3', context='con3')
@@ -917,10 +879,7 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_04))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
+        tasks.add_tasks(tasks=[self.task_02, self.task_04, self.task_01, self.task_03,])
         result = tasks.get_task_names_in_order(command='command1', context='con1')
 
         print_logger_lines(logger=logger)
@@ -951,10 +910,7 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_04))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
+        tasks.add_tasks(tasks=[self.task_02, self.task_04, self.task_01, self.task_03,])
         result = tasks.get_task_names_in_order(command='command1', context='con1')
 
         print_logger_lines(logger=logger)
@@ -967,6 +923,150 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
         self.assertEqual(result[2], 'test-task-01')
         self.assertEqual(result[3], 'test-task-02')
 
+    def test_task_names_in_dependency_levels_01(self):
+        self.task_02.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-01','test-task-03',],
+            }
+        ]
+        self.task_04.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-01','test-task-02',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_tasks(tasks=[self.task_02, self.task_04, self.task_01, self.task_03,])
+        result = tasks.get_task_names_in_dependency_levels(command='command1', context='con1')
+
+        print_logger_lines(logger=logger)
+
+        self.assertIsNotNone(result)
+        self.assertIsInstance(result, list)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0], ['test-task-01', 'test-task-03',])
+        self.assertEqual(result[1], ['test-task-02',])
+        self.assertEqual(result[2], ['test-task-04',])
+
+    def test_task_names_in_order_cached_until_task_added_01(self):
+        self.task_02.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-01',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
+        result = tasks.get_task_names_in_order(command='command1', context='con1')
+        self.assertEqual(result, ['test-task-01', 'test-task-02',])
+
+        result.append('not-a-task')
+        self.assertEqual(tasks.get_task_names_in_order(command='command1', context='con1'), ['test-task-01', 'test-task-02',])
+
+        tasks.add_task(task=self.task_03)
+        result = tasks.get_task_names_in_order(command='command1', context='con1')
+
+        print_logger_lines(logger=logger)
+
+        self.assertEqual(result, ['test-task-01', 'test-task-02', 'test-task-03',])
+
+    def test_task_names_in_order_follows_dependencies_depth_first_01(self):
+        self.task_01.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-03',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_tasks(tasks=[self.task_01, self.task_02, self.task_03,])
+        result = tasks.get_task_names_in_order(command='command1', context='con1')
+
+        print_logger_lines(logger=logger)
+
+        # Each task directly follows its dependencies, with tasks taken in the order they were added
+        self.assertEqual(result, ['test-task-03', 'test-task-01', 'test-task-02',])
+
+    def test_task_ordering_matches_task_names_in_order_01(self):
+        self.task_01.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-03',],
+            }
+        ]
+        self.task_04.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-02', 'test-task-01',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_tasks(tasks=[self.task_04, self.task_01, self.task_02, self.task_03,])
+        result = list()
+        for task_name in ('test-task-04', 'test-task-01', 'test-task-02', 'test-task-03',):
+            result = tasks._task_ordering(current_processing_order=result, candidate_task_name=task_name, command='command1', context='con1')
+
+        print_logger_lines(logger=logger)
+
+        self.assertEqual(result, ['test-task-02', 'test-task-03', 'test-task-01', 'test-task-04',])
+        self.assertEqual(result, tasks.get_task_names_in_order(command='command1', context='con1'))
+
+    def test_task_with_malformed_dependencies_01(self):
+        for malformed_dependency in (None, {'tasks': None,},):
+            with self.subTest(malformed_dependency=malformed_dependency):
+                self.task_01.metadata['processingScope'] = [
+                    {
+                        'commands': ['command2',],
+                    },
+                ]
+                self.task_01.metadata['dependencies'] = [malformed_dependency,]
+                tasks = Tasks()
+                tasks.add_tasks(tasks=[self.task_01, self.task_02,])
+                self.assertEqual(len(tasks), 2)
+
+                # The task with the malformed dependency is not in scope, so ordering is not affected
+                self.assertEqual(tasks.get_task_names_in_order(command='command1', context='con1'), ['test-task-02',])
+
+                # Once the task is in scope, the malformed dependency raises while the tasks are ordered
+                with self.assertRaises(TypeError):
+                    tasks.get_task_names_in_order(command='command2', context='con1')
+
+    def test_task_ordering_circular_dependency_raises_exception_01(self):
+        self.task_01.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-02',],
+            }
+        ]
+        self.task_02.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-01',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_tasks(tasks=[self.task_01, self.task_02, self.task_03,])
+        with self.assertRaises(Exception) as context:
+            tasks.get_task_names_in_order(command='command1', context='con1')
+        print_logger_lines(logger=logger)
+        self.assertTrue('Circular dependency' in str(context.exception))
+
+    def test_task_ordering_circular_dependency_raises_exception_02(self):
+        self.task_01.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-03',],
+            }
+        ]
+        self.task_02.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-01',],
+            }
+        ]
+        self.task_03.metadata['dependencies'] = [
+            {
+                'tasks': ['test-task-02',],
+            }
+        ]
+        tasks = Tasks()
+        tasks.add_tasks(tasks=[self.task_01, self.task_02, self.task_03,])
+        with self.assertRaises(Exception) as context:
+            tasks._task_ordering(current_processing_order=[], candidate_task_name='test-task-02', command='command1', context='con1')
+        print_logger_lines(logger=logger)
+        self.assertTrue('Circular dependency' in str(context.exception))
+
     def test_task_multiple_dependency_scenarios_01(self):
         self.task_02.metadata['dependencies'] = [
             {
@@ -976,8 +1076,8 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
         dependent_task_names_1 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con1')
         dependent_task_names_2 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command2', context='con1')
         dependent_task_names_3 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con2')
@@ -999,8 +1099,8 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
         dependent_task_names_1 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con1')
         dependent_task_names_2 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command2', context='con1')
         dependent_task_names_3 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con2')
@@ -1022,8 +1122,8 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
         dependent_task_names_1 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con1')
         dependent_task_names_2 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command2', context='con1')
         dependent_task_names_3 = tasks.get_task_dependencies_as_list_of_task_names(task_name='test-task-02', command='command1', context='con2')
@@ -1038,118 +1138,121 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
         self.assertFalse('test-task-01' in dependent_task_names_3)
 
     def test_task_processing_scope_scenarios_01(self):
+        # Each scenario: (processingScope metadata value, ((command, context, expected_result), ...))
+        scenarios = (
+            (
+                [{'commands': ['command1',], 'contexts': ['con1',],},],
+                (('command1', 'con1', True), ('command2', 'con1', False), ('command1', 'con2', False),),
+            ),
+            (
+                [{'commands': ['command1',],},],
+                (('command1', 'con1', True), ('command2', 'con1', False), ('command1', 'con2', True),),
+            ),
+            (
+                [{'contexts': ['con1',],},],
+                (('command1', 'con1', True), ('command2', 'con1', True), ('command1', 'con2', False),),
+            ),
+            (
+                None,
+                (('command1', 'con1', True), ('command2', 'con1', True), ('command1', 'con2', True),),
+            ),
+            (
+                'Invalid Type',
+                (('command1', 'con1', True), ('command2', 'con1', True), ('command1', 'con2', True),),
+            ),
+            (
+                [None, {'commands': ['command2',], 'contexts': ['con2',],},],
+                (('command1', 'con1', False), ('command2', 'con1', False), ('command1', 'con2', False), ('command2', 'con2', True),),
+            ),
+            (
+                ['Invalid Type', {'commands': ['command2',], 'contexts': ['con2',],},],
+                (('command1', 'con1', False), ('command2', 'con1', False), ('command1', 'con2', False), ('command2', 'con2', True),),
+            ),
+            (
+                [{'what?': 'This will produce a TRUE result',}, {'commands': ['command2',], 'contexts': ['con2',],},],
+                (('command1', 'con1', True), ('command2', 'con1', True), ('command1', 'con2', True), ('command2', 'con2', True),),
+            ),
+        )
+        for scenario_number, (processing_scope, expectations) in enumerate(scenarios, start=1):
+            self.task_01.metadata['processingScope'] = processing_scope
+            tasks = Tasks()
+            tasks.add_task(task=self.task_01)
+            for command, context, expected_result in expectations:
+                with self.subTest(scenario=scenario_number, command=command, context=context):
+                    self.assertIs(tasks.task_scoped_for_processing(task_name='test-task-01', command=command, context=context), expected_result)
+
+    def test_task_processing_scope_with_none_commands_raises_exception_01(self):
+        # A present but None value is not the same as leaving commands out, which would mean any command
         self.task_01.metadata['processingScope'] = [
             {
-                'commands': ['command1',],
+                'commands': None,
                 'contexts': ['con1',],
-            }
+            },
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
+        tasks.add_task(task=self.task_01)
+        with self.assertRaises(TypeError):
+            tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1')
 
-    def test_task_processing_scope_scenarios_02(self):
+    def test_task_names_scoped_for_processing_01(self):
         self.task_01.metadata['processingScope'] = [
             {
                 'commands': ['command1',],
             }
         ]
-        tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-
-    def test_task_processing_scope_scenarios_03(self):
-        self.task_01.metadata['processingScope'] = [
-            {
-                'contexts': ['con1',],
-            }
-        ]
-        tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-
-
-    def test_task_processing_scope_scenarios_04(self):
-        self.task_01.metadata['processingScope'] = None
-        tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-
-    def test_task_processing_scope_scenarios_05(self):
-        self.task_01.metadata['processingScope'] = 'Invalid Type'
-        tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-
-    def test_task_processing_scope_scenarios_06(self):
-        self.task_01.metadata['processingScope'] = [
-            None,
+        self.task_03.metadata['processingScope'] = [
             {
-                'commands': ['command2',],
                 'contexts': ['con2',],
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con2'))
+        tasks.add_task(task=self.task_03)
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
+        scope_cache = dict()
+        result = tasks.get_task_names_scoped_for_processing(command='command1', context='con1', scope_cache=scope_cache)
+        print_logger_lines(logger=logger)
+        self.assertEqual(result, ['test-task-02', 'test-task-01',])
+        self.assertEqual(len(scope_cache), 3)
+        self.assertFalse(scope_cache[('test-task-03', 'command1', 'con1',)])
+        self.assertEqual(tasks.get_task_names_scoped_for_processing(command='command2', context='con2'), ['test-task-03', 'test-task-02',])
 
-    def test_task_processing_scope_scenarios_07(self):
-        self.task_01.metadata['processingScope'] = [
-            'Invalid Type',
-            {
-                'commands': ['command2',],
-                'contexts': ['con2',],
-            }
-        ]
+    def test_loop_through_tasks_01(self):
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertFalse(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con2'))
+        tasks.add_task(task=self.task_01)
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_03)
+        tasks.add_task(task=self.task_04)
+        self.assertEqual(len(tasks), 4)
+        task: Task
+        for task in tasks:
+            self.assertIsNotNone(task)
+            self.assertIsInstance(task, Task)
+            self.assertTrue(task.task_id.startswith('test-task-0'))
 
-    def test_task_processing_scope_scenarios_08(self):
-        self.task_01.metadata['processingScope'] = [
-            {
-                'what?': 'This will produce a TRUE result',
-            },
+    def test_add_tasks_01(self):
+        self.task_02.metadata['dependencies'] = [
             {
-                'commands': ['command2',],
-                'contexts': ['con2',],
+                'tasks': ['test-task-01',],
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con1'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command1', context='con2'))
-        self.assertTrue(tasks.task_scoped_for_processing(task_name='test-task-01', command='command2', context='con2'))
+        tasks.add_task(task=self.task_03)
+        self.assertEqual(tasks.get_task_names_in_order(command='command1', context='con1'), ['test-task-03',])
+        tasks.add_tasks(tasks=[self.task_02, None, 'Invalid Type', self.task_01,])
+        self.assertEqual(len(tasks), 3)
+        self.assertEqual(tasks.get_task_names_in_order(command='command1', context='con1'), ['test-task-03', 'test-task-01', 'test-task-02',])
 
-    def test_loop_through_tasks_01(self):
+    def test_loop_through_tasks_in_name_order_01(self):
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_01))
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_03))
-        tasks.add_task(task=copy.deepcopy(self.task_04))
-        self.assertEqual(len(tasks), 4)
-        task: Task
+        tasks.add_task(task=self.task_03)
+        tasks.add_task(task=self.task_01)
+        tasks.add_task(task=self.task_02)
+        task_ids = [task.task_id for task in tasks]
+        self.assertEqual(task_ids, ['test-task-01', 'test-task-02', 'test-task-03',])
         for task in tasks:
-            self.assertIsNotNone(task)
-            self.assertIsInstance(task, Task)
-            self.assertTrue(task.task_id.startswith('test-task-0'))
+            task.metadata['changed'] = True
+        self.assertFalse('changed' in tasks.get_task_instance_by_name(task_name='test-task-01').metadata)
 
     def test_task_ordering_dependency_raises_exception_01(self):
         # setup most basic dependency
@@ -1165,8 +1268,8 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
             }
         ]
         tasks = Tasks()
-        tasks.add_task(task=copy.deepcopy(self.task_02))
-        tasks.add_task(task=copy.deepcopy(self.task_01))
+        tasks.add_task(task=self.task_02)
+        tasks.add_task(task=self.task_01)
         combinations = (
             {
                 'command': 'command1',
@@ -1221,6 +1324,10 @@ class TestTasks(unittest.TestCase):    # pragma: no cover
 
 class TestVariousFunctions(unittest.TestCase):    # pragma: no cover
 
+    # Widths of the column headers, without and with the checksum columns
+    COLUMN_HEADER_WIDTH = 90
+    COLUMN_HEADER_WITH_CHECKSUMS_WIDTH = 226
+
     def setUp(self):
         print()
         print('-'*80)
@@ -1233,26 +1340,67 @@ class TestVariousFunctions(unittest.TestCase):    # pragma: no cover
         result = produce_column_headers()
         print('RESULT:\n\n{}\n\n'.format(result))
         self.assertTrue('Manifest          Created  Created Timestamp          Spec Drifted       Resources Drifted' in result)
+        self.assertEqual(len(result), self.COLUMN_HEADER_WIDTH)
 
     def test_function_produce_column_headers_with_checksums_01(self):
         result = produce_column_headers(with_checksums=True)
         print('RESULT:\n\n{}\n\n'.format(result))
         self.assertTrue('Manifest          Created  Created Timestamp          Spec Drifted       Resources Drifted  Applied Spec CHecksum             Current Spec Checksum             Applied Resource Checksum         Current Resource Checksum' in result)
+        self.assertEqual(len(result), self.COLUMN_HEADER_WITH_CHECKSUMS_WIDTH)
 
     def test_produce_column_header_horizontal_line_basic_01(self):
         result = produce_column_header_horizontal_line()
         print('RESULT:\n\n{}\n\n'.format(result))
-        self.assertTrue('------------------------------------------------------------------------------------------' in result)
+        self.assertEqual(result, '-' * self.COLUMN_HEADER_WIDTH)
 
     def test_produce_column_header_horizontal_line_basic_02(self):
         result = produce_column_header_horizontal_line(line_char='=')
         print('RESULT:\n\n{}\n\n'.format(result))
-        self.assertTrue('==========================================================================================' in result)
+        self.assertEqual(result, '=' * self.COLUMN_HEADER_WIDTH)
 
     def test_produce_column_header_horizontal_line_with_checksums_01(self):
         result = produce_column_header_horizontal_line(with_checksums=True)
         print('RESULT:\n\n{}\n\n'.format(result))
-        self.assertTrue('----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------' in result)
+        self.assertEqual(result, '-' * self.COLUMN_HEADER_WITH_CHECKSUMS_WIDTH)
+
+    def test_function_calculate_json_checksum_01(self):
+        data = {'spec': {'field1': 'value1', 'field2': [1, 2, 3,]}, 'metadata': {'name': 'test'}}
+        result = calculate_json_checksum(data=data)
+        print('RESULT: {}'.format(result))
+        self.assertEqual(result, 'e2565a5253247c1ace9363d9a4b2ba0a69dda79755ecb8ab8b8718e1ce3e941a')
+
+    def test_function_calculate_string_checksum_01(self):
+        result = calculate_string_checksum(value='test_resource')
+        print('RESULT: {}'.format(result))
+        self.assertEqual(result, 'e87f3cf37884ebf44bab4c3364bafafe6bbae732f83e65b3ba5d5f19152e0c1f')
+
+    def test_function_calculate_json_checksum_default_to_str_01(self):
+        data = {'timestamp': datetime(2024, 1, 1, tzinfo=timezone.utc)}
+        with self.assertRaises(TypeError):
+            calculate_json_checksum(data=data)
+        result = calculate_json_checksum(data=data, default_to_str=True)
+        print('RESULT: {}'.format(result))
+        self.assertEqual(result, '0af5d604cbdeee9c0cddb6013814f025265375ca0f926ceccf65b6a95e842140')
+
+    def test_function_copy_variable_data_01(self):
+        shared_list = [1, 2, {'key': 'value'},]
+        data = {'first': shared_list, 'second': shared_list, 'items': (shared_list, 'text',), 'timestamp': datetime(2024, 1, 1, tzinfo=timezone.utc)}
+        result = copy_variable_data(data=data)
+        self.assertEqual(result, data)
+        self.assertIsNot(result['first'], shared_list)
+        self.assertIsNot(result['first'][2], shared_list[2])
+        # An object referenced more than once in the data is copied once, as with copy.deepcopy()
+        self.assertIs(result['first'], result['second'])
+        self.assertIs(result['items'][0], result['first'])
+
+    def test_function_copy_variable_data_self_referencing_01(self):
+        data = {'name': 'test',}
+        data['self'] = data
+        data['items'] = [data,]
+        result = copy_variable_data(data=data)
+        self.assertIsNot(result, data)
+        self.assertIs(result['self'], result)
+        self.assertIs(result['items'][0], result)
 
 
 class TestClassTaskState(unittest.TestCase):    # pragma: no cover
@@ -1264,6 +1412,19 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
 
     def tearDown(self):
         return super().tearDown()
+
+    def _create_created_task_state(self)->TaskState:
+        # State of a previously created resource, with no drift against field_value=1 and resource checksum 'a'
+        return TaskState(
+            manifest_spec={'field_value': 1},
+            applied_spec={'field_value': 1},
+            resolved_spec={'field_value': 1},
+            manifest_metadata={'name': 'test-task-01'},
+            report_label='test-task-01',
+            created_timestamp=1000,
+            applied_resources_checksum='a',
+            current_resource_checksum='a'
+        )
     
     def test_basic_init_01(self):
         task_state = TaskState()
@@ -1285,7 +1446,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         )
         print(str(task_state))
         drift_results_1 = task_state.to_dict(with_checksums=True)
-        print('\nDRIFT DATA: {}\n\n'.format(json.dumps(drift_results_1, default=str)))
+        print('\nDRIFT DATA: {}\n\n'.format(log_json_encoder.encode(drift_results_1)))
         self.assertTrue(drift_results_1['SpecDrifted'])
         self.assertEqual(drift_results_1['CreatedTimestamp'], 1000)
         self.assertEqual(drift_results_1['AppliedResourcesChecksum'], 'a')
@@ -1295,7 +1456,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         # Simulate a resource update
         task_state.update_applied_spec(new_applied_spec={'field_value': 2}, new_applied_resource_checksum='b', updated_timestamp=2000)
         drift_results_2 = task_state.to_dict(with_checksums=True)
-        print('\nDRIFT DATA: {}\n\n'.format(json.dumps(drift_results_2, default=str)))
+        print('\nDRIFT DATA: {}\n\n'.format(log_json_encoder.encode(drift_results_2)))
         self.assertFalse(drift_results_2['SpecDrifted'])
         self.assertEqual(drift_results_2['CreatedTimestamp'], 2000)
         self.assertEqual(drift_results_2['AppliedResourcesChecksum'], 'b')
@@ -1304,19 +1465,10 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
 
     def test_method_update_applied_spec_existing_resource_deleted_01(self):
         # Initial state of a previously created resource
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         print(str(task_state))
         drift_results_1 = task_state.to_dict(with_checksums=True)
-        print('\nDRIFT DATA: {}\n\n'.format(json.dumps(drift_results_1, default=str)))
+        print('\nDRIFT DATA: {}\n\n'.format(log_json_encoder.encode(drift_results_1)))
         self.assertIsNone(drift_results_1['SpecDrifted'])
         self.assertEqual(drift_results_1['CreatedTimestamp'], 1000)
         self.assertEqual(drift_results_1['AppliedResourcesChecksum'], 'a')
@@ -1325,24 +1477,54 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         # Simulate a resource being deleted
         task_state.update_applied_spec(new_applied_spec={'field_value': 1}, new_applied_resource_checksum=None, updated_timestamp=0)
         drift_results_2 = task_state.to_dict(with_checksums=True)
-        print('\nDRIFT DATA: {}\n\n'.format(json.dumps(drift_results_2, default=str)))
+        print('\nDRIFT DATA: {}\n\n'.format(log_json_encoder.encode(drift_results_2)))
         self.assertFalse(drift_results_2['SpecDrifted'])
         self.assertEqual(drift_results_2['CreatedTimestamp'], None)
         self.assertEqual(drift_results_2['AppliedResourcesChecksum'], None)
         self.assertEqual(drift_results_2['CurrentResourceChecksum'], None)
         self.assertFalse(task_state.is_created)
 
-    def test_method_column_str_basic_01(self):
+    def test_applied_spec_checksum_follows_applied_spec_01(self):
+        task_state = self._create_created_task_state()
+        drift_results_1 = task_state.to_dict(with_checksums=True)
+        self.assertFalse(drift_results_1['SpecDrifted'])
+        task_state.applied_spec = {'field_value': 2}
+        drift_results_2 = task_state.to_dict(with_checksums=True)
+        self.assertTrue(drift_results_2['SpecDrifted'])
+        self.assertNotEqual(drift_results_1['AppliedSpecChecksum'], drift_results_2['AppliedSpecChecksum'])
+        self.assertEqual(drift_results_2['AppliedSpecChecksum'], task_state.calculate_manifest_state_checksum(spec={'field_value': 2}))
+
+    def test_applied_spec_checksum_not_affected_by_changes_to_given_spec_01(self):
+        applied_spec = {'field_value': 1}
         task_state = TaskState(
             manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
+            applied_spec=applied_spec,
             resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
+            manifest_metadata={'name': 'test1'},
+            report_label='test1',
             created_timestamp=1000,
             applied_resources_checksum='a',
             current_resource_checksum='a'
         )
+        drift_results_1 = task_state.to_dict(with_checksums=True)
+        self.assertFalse(drift_results_1['SpecDrifted'])
+
+        # The state keeps its own copy of the applied spec, so the cached checksum stays correct
+        applied_spec['field_value'] = 2
+        drift_results_2 = task_state.to_dict(with_checksums=True)
+        self.assertFalse(drift_results_2['SpecDrifted'])
+        self.assertEqual(task_state.applied_spec, {'field_value': 1})
+        self.assertEqual(drift_results_2['AppliedSpecChecksum'], drift_results_1['AppliedSpecChecksum'])
+
+        new_applied_spec = {'field_value': 3}
+        task_state.applied_spec = new_applied_spec
+        new_applied_spec['field_value'] = 1
+        drift_results_3 = task_state.to_dict(with_checksums=True)
+        self.assertTrue(drift_results_3['SpecDrifted'])
+        self.assertEqual(drift_results_3['AppliedSpecChecksum'], task_state.calculate_manifest_state_checksum(spec={'field_value': 3}))
+
+    def test_method_column_str_basic_01(self):
+        task_state = self._create_created_task_state()
         result = task_state.column_str(
             human_readable=True,
             current_resolved_spec={'field_value': 1},
@@ -1354,16 +1536,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         self.assertTrue('test-task-01      Yes      1970-01-01 01:16:40        No                 No' in result)
 
     def test_method_column_str_resource_drifted_01(self):
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         result = task_state.column_str(
             human_readable=True,
             current_resolved_spec={'field_value': 1},
@@ -1375,16 +1548,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         self.assertTrue('test-task-01      Yes      1970-01-01 01:16:40        No                 Yes' in result)
 
     def test_method_column_str_spec_drifted_01(self):
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         result = task_state.column_str(
             human_readable=True,
             current_resolved_spec={'field_value': 2},
@@ -1396,16 +1560,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         self.assertTrue('test-task-01      Yes      1970-01-01 01:16:40        Yes                No' in result)
 
     def test_method_column_str_spec_and_resource_drifted_01(self):
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         result = task_state.column_str(
             human_readable=True,
             current_resolved_spec={'field_value': 2},
@@ -1417,16 +1572,7 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         self.assertTrue('test-task-01      Yes      1970-01-01 01:16:40        Yes                Yes' in result)
 
     def test_method_column_str_spec_and_resource_drifted_with_checksums_01(self):
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         result = task_state.column_str(
             human_readable=True,
             current_resolved_spec={'field_value': 2},
@@ -1439,72 +1585,52 @@ class TestClassTaskState(unittest.TestCase):    # pragma: no cover
         self.assertTrue('test-task-01      Yes      1970-01-01 01:16:40        Yes                Yes                38320c1e644eb074b24bb343e131e420  fcacd5b851d3ef945b3b11bf07ad1e17  a                                 b' in result)
 
     def test_method_repr(self):
-        task_state = TaskState(
-            manifest_spec={'field_value': 1},
-            applied_spec={'field_value': 1},
-            resolved_spec={'field_value': 1},
-            manifest_metadata={'name': 'test-task-01'},
-            report_label='test-task-01',
-            created_timestamp=1000,
-            applied_resources_checksum='a',
-            current_resource_checksum='a'
-        )
+        task_state = self._create_created_task_state()
         result = repr(task_state)
         print(result)
         self.assertIsNotNone(result)
         self.assertIsInstance(result, str)
 
 
+class UnitTestStatePersistence1(StatePersistence):
+
+    def load(self, on_failure: object=False)->bool:
+        self.state_cache['a'] = {'value': 1}
+        return True
+
+
 class TestClassStatePersistence(unittest.TestCase):    # pragma: no cover
 
     def setUp(self):
-        print()
-        print('-'*80)
         logger.reset()
 
-    def tearDown(self):
-        return super().tearDown()
-    
     def test_load_without_exception_01(self):
         p = StatePersistence()
         self.assertFalse(p.load())
 
     def test_load_with_exception_01(self):
         p = StatePersistence()
-        with self.assertRaises(Exception):
+        with self.assertRaisesRegex(Exception, 'TEST FAILURE'):
             p.load(on_failure=Exception('TEST FAILURE'))
 
     def test_update_and_get_01(self):
         p = StatePersistence()
         p.update_object_state(object_identifier='a', data={'result': 'it worked!'})
         result = p.get(object_identifier='a')
-        self.assertIsNotNone(result)
         self.assertIsInstance(result, dict)
         self.assertEqual(result['result'], 'it worked!')
 
-    def test_get_with_refresh_returns_empty_dict_01(self):
-        p = StatePersistence()
-        result = p.get(object_identifier='a')
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result, dict)
-        self.assertEqual(len(result), 0)
-
-    def test_get_without_refresh_returns_empty_dict_01(self):
-        p = StatePersistence()
-        result = p.get(object_identifier='a', refresh_cache_if_identifier_not_found=False)
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result, dict)
-        self.assertEqual(len(result), 0)
+    def test_get_returns_empty_dict_01(self):
+        for refresh_cache_if_identifier_not_found in (True, False):
+            with self.subTest(refresh_cache_if_identifier_not_found=refresh_cache_if_identifier_not_found):
+                p = StatePersistence()
+                result = p.get(object_identifier='a', refresh_cache_if_identifier_not_found=refresh_cache_if_identifier_not_found)
+                self.assertIsInstance(result, dict)
+                self.assertEqual(len(result), 0)
 
     def test_get_with_refresh_returns_valid_dict_01(self):
-        class MyStatePersistence(StatePersistence):
-            def load(self, on_failure: object=False)->bool:
-                self.state_cache['a'] = {'value': 1}
-                return True
-        
-        p = MyStatePersistence(load_on_init=False)
+        p = UnitTestStatePersistence1(load_on_init=False)
         result = p.get(object_identifier='a')
-        self.assertIsNotNone(result)
         self.assertIsInstance(result, dict)
         self.assertEqual(len(result), 1)
 
@@ -1512,20 +1638,14 @@ class TestClassStatePersistence(unittest.TestCase):    # pragma: no cover
         p = StatePersistence()
         p.update_object_state(object_identifier='a', data={'result': 'it worked!'})
         p.commit()
-        self.assertIsNotNone(p.state_cache)
         self.assertIsInstance(p.state_cache, dict)
         self.assertEqual(len(p.state_cache), 1)
 
 class TestClassParameterValidation(unittest.TestCase):    # pragma: no cover
 
     def setUp(self):
-        print()
-        print('-'*80)
         logger.reset()
 
-    def tearDown(self):
-        return super().tearDown()
-    
     def test_basic_01(self):
         pv = ParameterValidation(constraints=None)
         result = pv.validation_passed(parameters=dict())
@@ -1677,6 +1797,48 @@ class TestClassTaskProcessingActionParameterValidation(unittest.TestCase):    #
             self.assertFalse(result)
             logger.reset()
 
+    def test_add_command_and_context_after_validation_01(self):
+        pv = TaskProcessingActionParameterValidation(
+            constraints={
+                'SupportedCommands': ['command1',],
+                'SupportedContexts': ['context1',],
+            },
+            auto_init_supported_actions=True
+        )
+        parameters = {
+            'Action': 'CreateAction',
+            'Command': 'command2',
+            'Context': 'context2'
+        }
+        self.assertFalse(pv.validation_passed(parameters=parameters))
+        pv.add_command(command='command2')
+        self.assertFalse(pv.validation_passed(parameters=parameters))
+        pv.add_context(context='context2')
+        self.assertTrue(pv.validation_passed(parameters=parameters))
+        print_logger_lines(logger=logger)
+
+    def test_constraints_modified_after_validation_01(self):
+        pv = TaskProcessingActionParameterValidation(
+            constraints={
+                'SupportedCommands': ['command1',],
+                'SupportedActions': ['action1',],
+            },
+            auto_init_supported_actions=True
+        )
+        parameters = {
+            'Action': 'action2',
+            'Command': 'command1',
+            'Context': 'context1'
+        }
+        self.assertFalse(pv.validation_passed(parameters=parameters))
+        pv.constraints['SupportedActions'].append('action2')
+        self.assertTrue(pv.validation_passed(parameters=parameters))
+        pv.constraints['SupportedContexts'] = ['context2',]
+        self.assertFalse(pv.validation_passed(parameters=parameters))
+        pv.constraints['SupportedContexts'][0] = 'context1'
+        self.assertTrue(pv.validation_passed(parameters=parameters))
+        print_logger_lines(logger=logger)
+
 
 class TestClassVariableStore(unittest.TestCase):    # pragma: no cover
 
@@ -1694,9 +1856,12 @@ class TestClassVariableStore(unittest.TestCase):    # pragma: no cover
             v.get_variable(variable_name='a', pop_item=False)
         with self.assertRaises(Exception):
             v.get_variable(variable_name='a', pop_item=True)
+        self.assertFalse('a' in v)
         v.add_variable(variable_name='a', value=100)
+        self.assertTrue('a' in v)
         result1 = v.get_variable(variable_name='a', pop_item=False)
         result2 = v.get_variable(variable_name='a', pop_item=True)
+        self.assertFalse('a' in v)
         with self.assertRaises(Exception):
             v.get_variable(variable_name='a', pop_item=False)
         with self.assertRaises(Exception):
@@ -1706,6 +1871,31 @@ class TestClassVariableStore(unittest.TestCase):    # pragma: no cover
             self.assertIsInstance(result, int)
             self.assertEqual(result, 100)
 
+    def test_clone_01(self):
+        v = VariableStore()
+        v.add_variable(variable_name='a', value={'list': [1, 'two', {'three': 3.0}], 'tuple': (None, True,), 'set': {'x',}})
+        cloned = v.clone()
+        self.assertIsInstance(cloned, VariableStore)
+        self.assertEqual(cloned.variable_store, v.variable_store)
+        cloned.variable_store['a']['list'][2]['three'] = 4.0
+        cloned.variable_store['a']['set'].add('y')
+        cloned.add_variable(variable_name='b', value=1)
+        self.assertEqual(v.variable_store['a']['list'][2]['three'], 3.0)
+        self.assertEqual(v.variable_store['a']['set'], {'x',})
+        self.assertFalse('b' in v.variable_store)
+
+    def test_shallow_clone_01(self):
+        v = VariableStore()
+        v.add_variable(variable_name='a', value={'list': [1, 2,]})
+        v.add_variable(variable_name='b', value=1)
+        cloned = v.shallow_clone()
+        self.assertIsInstance(cloned, VariableStore)
+        self.assertIs(cloned.variable_store['a'], v.variable_store['a'])
+        cloned.add_variable(variable_name='c', value=2)
+        cloned.variable_store.pop('b')
+        self.assertFalse('c' in v)
+        self.assertTrue('b' in v)
+
 
 class TestClassTask(unittest.TestCase):    # pragma: no cover
 
@@ -1741,6 +1931,19 @@ class TestClassTask(unittest.TestCase):    # pragma: no cover
         self.assertTrue('name' in t.spec)
         self.assertEqual(t.spec['name'], 'value')
 
+    def test_spec_json_01(self):
+        t = Task(
+            api_version='unittest',
+            kind='TestKind',
+            metadata={'name': 'test'},
+            spec={'name': 'value'}
+        )
+        self.assertEqual(t.spec_json, json.dumps({'name': 'value'}))
+        self.assertIs(t.spec_json, t.spec_json)
+
+        t.spec = {'name': 'other value'}
+        self.assertEqual(t.spec_json, json.dumps({'name': 'other value'}))
+
     def test_invalid_dicts_create_empty_dicts_basic_01(self):
         t = Task(
             api_version='unittest',
@@ -1791,11 +1994,11 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -1809,7 +2012,7 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
             tp.process_task(
                 task=self.task,
                 action='CreateAction',
-                variable_store=copy.deepcopy(vs),
+                variable_store=vs,
                 task_resolved_spec={'testField': 'testValue'}
             )
 
@@ -1827,11 +2030,11 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -1845,7 +2048,7 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
             tp.process_task(
                 task=self.task,
                 action='UpdateAction',
-                variable_store=copy.deepcopy(vs),
+                variable_store=vs,
                 task_resolved_spec={'testField': 'testValue'}
             )
 
@@ -1861,7 +2064,7 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
         variable_store = tp.process_task(
             task=self.task,
             action='RollbackAction',
-            variable_store=copy.deepcopy(variable_store),
+            variable_store=variable_store,
             task_resolved_spec={'testField': 'testValue'}
         )
 
@@ -1869,11 +2072,11 @@ class TestClassTaskProcessor(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertIsNotNone(variable_store)
@@ -2031,11 +2234,11 @@ class TestClassTaskProcessingHook(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(vs)
+            variable_store=vs
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(vs)
+            variable_store=vs
         )
 
         self.assertIsNotNone(vs)
@@ -2394,6 +2597,18 @@ class TestClassResolveTaskSpecVariablesHook(unittest.TestCase):    # pragma: no
         self.assertEqual(original_data, result)
 
 
+class CommitCountingStatePersistence(StatePersistence):
+
+    def __init__(self, configuration: dict=dict(), load_on_init: bool=True):
+        super().__init__(configuration, load_on_init)
+        self.commit_count = 0
+        self.committed_state = dict()
+
+    def commit(self):
+        self.commit_count += 1
+        self.committed_state = copy.deepcopy(self.state_cache)
+
+
 class TestClassTaskPostProcessingStateUpdateHook(unittest.TestCase):    # pragma: no cover
 
     def setUp(self):
@@ -2441,11 +2656,11 @@ class TestClassTaskPostProcessingStateUpdateHook(unittest.TestCase):    # pragma
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_state(task=self.task, persistence=persistence)
 
@@ -2477,6 +2692,27 @@ class TestClassTaskPostProcessingStateUpdateHook(unittest.TestCase):    # pragma
             self.assertTrue(field_name in current_state)
             self.assertIsInstance(current_state[field_name], type(expected_data))
 
+    def test_commit_after_update_01(self):
+        for commit_after_update, expected_commit_count in ((False, 0), (True, 1),):
+            persistence = CommitCountingStatePersistence()
+            tp = DummyTaskProcessor1()
+            variable_store = tp.process_task(
+                task=copy.deepcopy(self.task),
+                persistence=persistence,
+                variable_store=VariableStore(),
+                action='CreateAction',
+                task_resolved_spec={'testField': 'testValue'}
+            )
+            h = TaskPostProcessingStateUpdateHook(commit_after_update=commit_after_update)
+            h.run(
+                task=copy.deepcopy(self.task),
+                persistence=persistence,
+                variable_store=variable_store
+            )
+            print_logger_lines(logger=logger)
+            self.assertIsNotNone(persistence.get(object_identifier='{}:TASK_STATE'.format(self.task.task_id)))
+            self.assertEqual(persistence.commit_count, expected_commit_count)
+
     def test_method__validate_data_missing_field_in_data_returns_false_01(self):
         h = TaskPostProcessingStateUpdateHook()
         data = {
@@ -2636,11 +2872,11 @@ class TestClassGeneralErrorHook(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertTrue('An Unspecified Error Occurred' in logger.error_lines[0])
@@ -2653,11 +2889,11 @@ class TestClassGeneralErrorHook(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertTrue('An Unspecified Error Occurred' in logger.error_lines[0])
@@ -2681,11 +2917,11 @@ class TestClassGeneralErrorHook(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
         self.assertTrue('Test Non Critical Error' in logger.error_lines[0])
@@ -2948,11 +3184,11 @@ class TestClassWorkflowExecutor(unittest.TestCase):    # pragma: no cover
         dump_variable_store(
             test_class_name=self.__class__.__name__,
             test_method_name=stack()[0][3],
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
         dump_events(
             task_id=self.task_01.task_id,
-            variable_store=copy.deepcopy(variable_store)
+            variable_store=variable_store
         )
 
     def test_method_execute_workflow_no_ordered_workflow_produces_exception_01(self):
@@ -2997,6 +3233,33 @@ class TestClassWorkflowExecutor(unittest.TestCase):    # pragma: no cover
 
         print_logger_lines(logger=logger)
 
+    def test_method_execute_workflow_task_exception_commits_earlier_state_01(self):
+        variable_store = VariableStore()
+        variable_store.add_variable(
+            variable_name='{}:UNITTEST_TROW_EXCEPTION'.format(self.task_01.task_id),
+            value=True
+        )
+        persistence = CommitCountingStatePersistence()
+        we = WorkflowExecutor(task_process_store=self.task_processor_store, persistence=persistence, variable_store=variable_store)
+        we.add_task(task=self.task_01)
+        we.add_task(task=self.task_02)
+        we.add_task(task=self.task_03)
+        we.add_task(task=self.task_04)
+        we.add_workflow_step_by_hook_instance(hook=TaskProcessingHook())
+        we.add_workflow_step_by_hook_instance(hook=TaskPostProcessingStateUpdateHook())
+
+        # test-task-03 and test-task-04 are processed before test-task-01, which fails
+        self.assertEqual(we.tasks.get_task_names_in_order(command='create', context='con1')[0:3], ['test-task-03', 'test-task-04', 'test-task-01',])
+        with self.assertRaises(Exception):
+            we.execute_workflow(command='create', context='con1')
+
+        print_logger_lines(logger=logger)
+
+        self.assertEqual(persistence.commit_count, 1)
+        self.assertTrue('test-task-03:TASK_STATE' in persistence.committed_state)
+        self.assertTrue('test-task-04:TASK_STATE' in persistence.committed_state)
+        self.assertFalse('test-task-01:TASK_STATE' in persistence.committed_state)
+
 
 
 if __name__ == '__main__':